@@ -17,6 +17,7 @@ if os.path.exists(elastic_env_path):
 # Set up environment variables
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 TIMEOUT_SECS = int(os.getenv("TIMEOUT_SECS", "30"))
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 CONGRESS_API_KEY = os.getenv("CONGRESS_API_KEY", "")
 CONGRESS_API_URL = os.getenv("CONGRESS_API_URL", "")
 ELASTIC_API_URL = os.getenv("ELASTIC_API_URL", "")
@@ -30,6 +31,8 @@ RABBITMQ_PREFETCH = int(os.getenv("RABBITMQ_PREFETCH", "200"))
 RABBITMQ_RATE_LIMIT_PER_HOUR = int(os.getenv("RABBITMQ_RATE_LIMIT_PER_HOUR", "5000"))
 RABBITMQ_PAGE_SIZE = int(os.getenv("RABBITMQ_PAGE_SIZE", "250"))
 RABBITMQ_API_WORKERS = int(os.getenv("RABBITMQ_API_WORKERS", "4"))
+# Keep-alive connections pooled per host by the Congress.gov HTTP session.
+CONGRESS_HTTP_POOL_SIZE = int(os.getenv("CONGRESS_HTTP_POOL_SIZE", "32"))
 # When true, the client will raise an error if response fields are
 # present in the API payload but not represented in our Pydantic models.
 # Set via environment variable to one of: 1,true,yes
@@ -0,0 +1,447 @@
+"""Asynchronous Congress.gov API client built on aiohttp.
+
+`AsyncCDGClient` shares spec rendering, record extraction and coercion with
+`CDGClient` but performs HTTP with a pooled `aiohttp.ClientSession`. Once
+the first page of a paginated endpoint reports its total count, the
+remaining pages are requested concurrently, bounded by a semaphore and the
+client-wide rate limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import Awaitable, Callable, Iterable, Mapping, TypeVar
+
+import aiohttp
+import orjson
+from pydantic import BaseModel
+from tqdm import tqdm
+
+from src.data_collection.client import CDGClient, Json
+from src.data_collection.http_cache import ResponseCache
+from src.data_collection.rate_limit import AdaptiveConcurrency
+from src.data_collection.utils import resolve_pagination
+from src.models.endpoint_spec import EndpointSpec, PaginationType
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Idle keep-alive and DNS cache lifetimes (seconds) for the connection pool.
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+# Status codes retried with exponential backoff.
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+# Throttling status; retried after Retry-After and shrinks an adaptive gate.
+THROTTLE_STATUS = 429
+_RETRYABLE_STATUSES = RETRY_STATUSES | {THROTTLE_STATUS}
+
+Page = tuple[list[BaseModel], Mapping[str, Json], Mapping[str, Json]]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncCDGClient(CDGClient):
+    """Async client for Congress.gov API requests.
+
+    Use as an async context manager so the underlying connection pool is
+    closed::
+
+        async with AsyncCDGClient(api_key) as client:
+            pages = await client.afetch_pages(spec)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        concurrency: int = 20,
+        connector_limit: int = 64,
+        limit_per_host: int = 20,
+        max_retries: int = 3,
+        retry_base_delay: float = 0.3,
+        adaptive_concurrency: bool = False,
+        **kwargs,
+    ) -> None:
+        """Initialize the AsyncCDGClient.
+
+        Args:
+            api_key: API key for Congress.gov.
+            concurrency: maximum number of requests in flight at once.
+            connector_limit: total connection pool size.
+            limit_per_host: connection pool size per host.
+            max_retries: retries for connection errors and 5xx responses.
+            retry_base_delay: initial backoff delay in seconds.
+            adaptive_concurrency: if True, `concurrency` is only the upper
+                bound: the in-flight limit starts low, grows on success and
+                halves on HTTP 429 (AIMD).
+            **kwargs: forwarded to :class:`CDGClient`, including
+                ``rate_limiter``; the sync and async paths share one bucket.
+                ``cache`` is not supported: the async path does not send
+                conditional requests.
+
+        Raises:
+            ValueError: if a response ``cache`` is passed.
+        """
+        if kwargs.get("cache") is not None:
+            raise ValueError("AsyncCDGClient does not support a response cache")
+        super().__init__(api_key, **kwargs)
+        self._concurrency = concurrency
+        self._connector_limit = connector_limit
+        self._limit_per_host = limit_per_host
+        self._max_retries = max_retries
+        self._retry_base_delay = retry_base_delay
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._gate: asyncio.Semaphore | AdaptiveConcurrency = (
+            AdaptiveConcurrency(initial=min(4, concurrency), max_limit=concurrency)
+            if adaptive_concurrency
+            else self._semaphore
+        )
+        self._asession: aiohttp.ClientSession | None = None
+        # Requests currently on the wire, keyed by URL + query; concurrent
+        # identical GETs await the same task instead of hitting the API twice.
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Callers currently awaiting each in-flight key.
+        self._waiters: dict[str, int] = {}
+
+    async def __aenter__(self) -> "AsyncCDGClient":
+        """Open the aiohttp session."""
+        self._get_asession()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the aiohttp session."""
+        await self.aclose()
+
+    def _get_asession(self) -> aiohttp.ClientSession:
+        """Return the pooled aiohttp session, creating it on first use."""
+        if self._asession is None or self._asession.closed:
+            # Keep idle connections (and the resolved address) long enough
+            # to span pagination gaps so TLS sessions are reused rather than
+            # re-handshaken between rate-limited requests.
+            connector = aiohttp.TCPConnector(
+                limit=self._connector_limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+            self._asession = aiohttp.ClientSession(
+                connector=connector, headers=dict(self._session.headers)
+            )
+        return self._asession
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session if it is open."""
+        if self._asession is not None and not self._asession.closed:
+            await self._asession.close()
+        self._asession = None
+
+    async def _arequest_json(
+        self, url: str, params: Mapping[str, str], timeout: int = 10
+    ) -> Json:
+        """GET `url` and decode its JSON body, coalescing identical requests.
+
+        While a request for the same URL and query is in flight, further
+        callers share its response body. Each caller decodes the body itself,
+        so callers that mutate their result (e.g. `coerce_records`
+        normalizing ``notes``) do not affect each other. Cancelling one caller
+        does not cancel the shared request unless no other caller is waiting.
+        """
+        query = {**dict(self._session.params or {}), **params}
+        key = ResponseCache.make_key(url, query)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._asend(url, query, timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget_inflight(key, t))
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            body = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[key] == 1:
+                # Unregister first so a new caller starts a fresh request
+                # instead of awaiting the one being cancelled.
+                self._forget_inflight(key, task)
+                task.cancel()
+            raise
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+        return orjson.loads(body)
+
+    def _forget_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Drop `key` from the in-flight map if it still refers to `task`."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _asend(
+        self, url: str, query: Mapping[str, str], timeout: int = 10
+    ) -> bytes:
+        """GET `url` with retries; enforce a JSON response and return its body.
+
+        Connection errors, 5xx and 429 responses are retried with exponential
+        backoff (at least ``Retry-After`` for 429); other HTTP errors raise
+        immediately.
+        """
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        adaptive = self._gate if isinstance(self._gate, AdaptiveConcurrency) else None
+        attempt = 0
+        while True:
+            await self._bucket.acquire_async()
+            retry_after: float | None = None
+            try:
+                # The gate is held per attempt so backoff sleeps free the slot.
+                async with self._gate:
+                    async with self._get_asession().get(
+                        url, params=query, timeout=client_timeout
+                    ) as resp:
+                        if resp.status == THROTTLE_STATUS:
+                            if adaptive is not None:
+                                adaptive.on_throttle()
+                            retry_after = _retry_after_seconds(
+                                resp.headers.get("Retry-After")
+                            )
+                        if resp.status in _RETRYABLE_STATUSES:
+                            raise aiohttp.ClientResponseError(
+                                resp.request_info,
+                                resp.history,
+                                status=resp.status,
+                                message=f"retryable status: {resp.status}",
+                            )
+                        resp.raise_for_status()
+                        # content_type is the parsed, lower-cased MIME type.
+                        if not resp.content_type.startswith("application/json"):
+                            raise ValueError(
+                                "Non-JSON response received from Congress.gov API"
+                            )
+                        body = await resp.read()
+                if adaptive is not None:
+                    adaptive.on_success()
+                return body
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                retryable = not isinstance(exc, aiohttp.ClientResponseError) or (
+                    exc.status in _RETRYABLE_STATUSES
+                )
+                if not retryable or attempt >= self._max_retries:
+                    raise
+                delay = self._retry_base_delay * (2**attempt)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                attempt += 1
+                logger.debug(
+                    "retrying %s in %.2fs after %s", url, delay, exc.__class__.__name__
+                )
+                await asyncio.sleep(delay)
+
+    async def aget_json(
+        self, endpoint: str, params: Mapping[str, Json] | None = None, timeout: int = 10
+    ) -> Mapping[str, Json]:
+        """Async counterpart of `CDGClient.get_json`."""
+        p = {k: str(v) for k, v in (params or {}).items()}
+        parsed = await self._arequest_json(
+            self._endpoint_url(endpoint), p, timeout=timeout
+        )
+        if not isinstance(parsed, dict):
+            raise ValueError("JSON response is not an object mapping")
+        return parsed
+
+    async def aget_many(
+        self,
+        endpoints: list[str],
+        params: Mapping[str, Json] | None = None,
+        timeout: int = 10,
+    ) -> list[Mapping[str, Json]]:
+        """Fetch independent `endpoints` concurrently, returning results in order.
+
+        Concurrency is bounded by the client semaphore and rate limiter, so
+        e.g. one request per historical congress completes in roughly
+        ``len(endpoints) / concurrency`` round trips instead of one each.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.aget_json(e, params, timeout=timeout) for e in endpoints)
+            )
+        )
+
+    async def arun_many(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        concurrency: int = 16,
+    ) -> list[R | BaseException]:
+        """Await ``func(item)`` for every item, at most `concurrency` at a time.
+
+        Intended for per-entity detail fetches (e.g. ``Bill.aadd_bill_details``)
+        that themselves issue several requests: the outer bound limits how
+        many entities are in progress while the client semaphore and rate
+        limiter still govern the individual requests. Results are returned
+        in item order; failures are returned as exception instances rather
+        than cancelling the rest of the batch.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def guarded(item: T) -> R:
+            async with sem:
+                return await func(item)
+
+        return list(
+            await asyncio.gather(
+                *(guarded(item) for item in items), return_exceptions=True
+            )
+        )
+
+    async def arequest_for_spec(
+        self,
+        spec: EndpointSpec,
+        runtime_params: dict[str, Json],
+        timeout: int = 10,
+        extra_query: Mapping[str, Json] | None = None,
+    ) -> Mapping[str, Json]:
+        """Async counterpart of `CDGClient.request_for_spec`."""
+        spec.validate_params(runtime_params)
+        url = spec.render_path(self.base_url, runtime_params)
+        query = spec.build_query(runtime_params)
+        if extra_query:
+            query = {**query, **extra_query}
+        parsed = await self._arequest_json(
+            url, {k: str(v) for k, v in (query or {}).items()}, timeout=timeout
+        )
+        if not isinstance(parsed, dict):
+            raise ValueError("Unexpected JSON shape: expected object mapping")
+        return parsed
+
+    async def _afetch_page(
+        self,
+        spec: EndpointSpec,
+        model_cls: type[BaseModel],
+        params: dict[str, Json],
+        offset: int,
+        page_size: int,
+    ) -> Page | None:
+        """Fetch and coerce the page starting at `offset`; None when empty."""
+        page_query = self._page_query(spec.pagination, offset, page_size)
+        resp = await self.arequest_for_spec(spec, params, extra_query=page_query)
+        records = self._extract_records_from_response(spec, resp)
+        if not records:
+            return None
+        coerced = self.coerce_records(model_cls, records)
+        meta = resolve_pagination(
+            dict(resp), records_len=len(records), offset=offset, page_size=page_size
+        )
+        return coerced, resp, {
+            "offset": offset,
+            "limit": page_size,
+            "next_offset": meta.next_offset,
+            "total": meta.total,
+        }
+
+    async def afetch_pages(
+        self,
+        spec: EndpointSpec,
+        base_params: Mapping[str, Json] | None = None,
+        progress: bool = False,
+    ) -> list[Page]:
+        """Fetch every page of `spec`, returning pages in offset order.
+
+        Each element matches what `CDGClient.iterate_pages` yields. The first
+        page is fetched alone to learn the total count; the remaining
+        offsets are then requested concurrently. When the API does not
+        report a total, pages are followed sequentially. With `progress`,
+        a tqdm bar counts records as each page completes.
+        """
+        params: dict[str, Json] = dict(base_params or {})
+        pagination = spec.pagination
+        model_cls = self._resolve_response_model(spec)
+
+        if not pagination:
+            resp = await self.arequest_for_spec(spec, params)
+            records = self._extract_records_from_response(spec, resp)
+            return [(self.coerce_records(model_cls, records), resp, {})]
+
+        if pagination.type not in (PaginationType.OFFSET, PaginationType.PAGE):
+            raise ValueError(f"unsupported pagination type: {pagination.type}")
+
+        offset, page_size = self._page_window(pagination, params)
+        first = await self._afetch_page(spec, model_cls, params, offset, page_size)
+        if first is None:
+            return []
+        pages = [first]
+        meta = first[2]
+        next_offset, total = meta["next_offset"], meta["total"]
+        pbar = tqdm(total=total, desc=spec.name, unit="record", disable=not progress)
+        pbar.update(len(first[0]))
+        try:
+            if next_offset == -1 or next_offset <= offset:
+                return pages
+
+            if total:
+                # The server may cap the page size below what was asked for;
+                # the first page's advance is the size it actually serves, so
+                # request and step by that to avoid skipping records.
+                step = next_offset - offset
+
+                async def indexed(i: int, o: int) -> tuple[int, Page | None]:
+                    return i, await self._afetch_page(
+                        spec, model_cls, params, o, step
+                    )
+
+                offsets = range(next_offset, total, step)
+                rest: list[Page | None] = [None] * len(offsets)
+                tasks = [
+                    asyncio.ensure_future(indexed(i, o)) for i, o in enumerate(offsets)
+                ]
+                try:
+                    # Progress advances as pages finish; results keep offset order.
+                    for fut in asyncio.as_completed(tasks):
+                        i, page = await fut
+                        rest[i] = page
+                        if page is not None:
+                            pbar.update(len(page[0]))
+                finally:
+                    # If a page failed, stop the requests still outstanding.
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                pages.extend(page for page in rest if page is not None)
+                return pages
+
+            while next_offset != -1 and next_offset > offset:
+                offset = next_offset
+                page = await self._afetch_page(
+                    spec, model_cls, params, offset, page_size
+                )
+                if page is None:
+                    break
+                pages.append(page)
+                pbar.update(len(page[0]))
+                next_offset = page[2]["next_offset"]
+            return pages
+        finally:
+            pbar.close()
+
+    async def afetch_all(
+        self,
+        spec: EndpointSpec,
+        base_params: Mapping[str, Json] | None = None,
+        progress: bool = False,
+    ) -> list[BaseModel]:
+        """Fetch every page of `spec` and return the coerced records, in order.
+
+        Async counterpart of exhausting `CDGClient.iterate_pages`; pages after
+        the first are fetched concurrently by `afetch_pages`.
+        """
+        pages = await self.afetch_pages(spec, base_params, progress=progress)
+        return list(itertools.chain.from_iterable(page for page, _, _ in pages))
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a delta-seconds ``Retry-After`` header; HTTP dates are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -5,18 +5,34 @@ Pydantic model instances from `iterate_pages`. It intentionally avoids
 returning mixed types or raw byte fallbacks.
 """
 
+import functools
 import importlib
 import inspect
 import threading
 import time
-from typing import Iterator, Mapping, Union, TypeAlias, cast
+from typing import Callable, Iterator, Literal, Mapping, TypeAlias, TypeVar, Union, cast
 from urllib.parse import urljoin
 
+import orjson
 import requests
-from pydantic import BaseModel
-
-from settings import CONGRESS_API_KEY, CONGRESS_STRICT_FIELD_CHECK
-from src.models.endpoint_spec import EndpointSpec
+from pydantic import BaseModel, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from settings import (
+    CONGRESS_API_KEY,
+    CONGRESS_HTTP_POOL_SIZE,
+    CONGRESS_STRICT_FIELD_CHECK,
+)
+from src.data_collection.http_cache import CachedResponse, ResponseCache
+from src.data_collection.rate_limit import (
+    RateLimiter,
+    SlidingWindowLimiter,
+    TokenBucket,
+)
+from src.data_collection.utils import resolve_pagination
+from src.models.endpoint_spec import EndpointSpec, PaginationSpec, PaginationType
+from src.models.shared import list_adapter
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +41,15 @@ logger = get_logger(__name__)
 API_VERSION = "v3"
 ROOT_URL = "https://api.congress.gov/"
 RESPONSE_FORMAT = "json"
+# Size of the keep-alive pool mounted on the session. It must cover the
+# concurrent page workers plus the nine parallel bill sub-resource fetches,
+# otherwise surplus connections are discarded and re-handshaken.
+POOL_SIZE = CONGRESS_HTTP_POOL_SIZE
+# Congress.gov allows 5000 requests/hour per key. The client-wide token
+# bucket admits that rate on average and lets short bursts through so
+# concurrent page and detail fetches are not serialized.
+DEFAULT_REQUESTS_PER_HOUR = 5000
+DEFAULT_BURST = 50
 
 # JSON-like value type used for request/response mappings. This is a
 # conservative, recursive alias that avoids `Any` while accurately
@@ -40,6 +65,9 @@ Json: TypeAlias = Union[
 ]
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
 # Helper: detect JSON responses
 def _is_json_response(response: requests.Response) -> bool:
     """Return True if the HTTP response is a JSON response.
@@ -50,8 +78,34 @@ def _is_json_response(response: requests.Response) -> bool:
     Returns:
         bool: True when the Content-Type header indicates JSON.
     """
-    ct = response.headers.get("content-type", "")
-    return ct.lower().startswith("application/json")
+    ct = response.headers.get("content-type")
+    # Slice before lowering so only the 16-char prefix is copied.
+    return ct is not None and ct[:16].lower() == "application/json"
+
+
+def _decode_json(response: requests.Response) -> Json:
+    """Decode a response body with ``orjson``.
+
+    Args:
+        response: requests.Response whose body is JSON.
+
+    Returns:
+        Json: the decoded JSON value.
+    """
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=None)
+def _exported_keys(model_cls: type[BaseModel]) -> frozenset[str]:
+    """Return the top-level keys ``model_dump(by_alias=True)`` emits for ``model_cls``.
+
+    Computed once per model so the field-coverage check in `coerce_records`
+    does not need to dump every validated instance.
+    """
+    return frozenset(
+        f.serialization_alias or f.alias or name
+        for name, f in model_cls.model_fields.items()
+    )
 
 
 def _to_int(value: object, default: int) -> int:
@@ -72,6 +126,75 @@ def _to_int(value: object, default: int) -> int:
         return default
 
 
+def create_session_with_retries(
+    pool_size: int = POOL_SIZE,
+    total_retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+) -> requests.Session:
+    """Return a keep-alive `requests.Session` with pooled, retrying adapters.
+
+    Transient connection errors and the statuses in `status_forcelist` are
+    retried by urllib3 with exponential backoff, honouring `Retry-After` on
+    429/503. Once retries are exhausted the final response is returned (not
+    raised) so the caller's error handling still sees the status code. Pass
+    an empty `status_forcelist` when the caller retries statuses itself, so
+    only connection errors are retried here.
+
+    Args:
+        pool_size: keep-alive connections kept per host.
+        total_retries: maximum transport-level retries per request.
+        backoff_factor: urllib3 backoff factor between retries.
+        status_forcelist: HTTP statuses that trigger a retry; empty disables
+            status retries (including `Retry-After` handling).
+
+    Returns:
+        requests.Session: session with the adapter mounted for http and https.
+    """
+    retry = Retry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        # urllib3 retries 413/429/503 carrying Retry-After even when they are
+        # not in the forcelist, so tie that behaviour to the forcelist too.
+        respect_retry_after_header=bool(status_forcelist),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+# Pool size of the shared session used by module-level download helpers,
+# which may run many transfers concurrently.
+SHARED_POOL_SIZE = 64
+
+_SHARED_SESSION: requests.Session | None = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide retrying session, creating it on first use.
+
+    Helpers that make ad-hoc requests outside a :class:`CDGClient` (e.g.
+    PDF downloads) share this session so repeated calls reuse pooled
+    keep-alive connections instead of opening a new pool each time.
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        with _SHARED_SESSION_LOCK:
+            if _SHARED_SESSION is None:
+                _SHARED_SESSION = create_session_with_retries(
+                    pool_size=SHARED_POOL_SIZE
+                )
+    return _SHARED_SESSION
+
+
 # Explicit JSON helper method is implemented on the client class below.
 
 
@@ -89,6 +212,10 @@ class CDGClient:
         response_format: str = RESPONSE_FORMAT,
         raise_on_error: bool = True,
         added_headers: dict[str, str] | None = None,
+        cache: ResponseCache | None = None,
+        skip_invalid_records: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        limiter: Literal["token", "sliding"] = "token",
     ) -> None:
         """Initialize the CDGClient.
 
@@ -98,9 +225,23 @@ class CDGClient:
             response_format: desired response format (default 'json').
             raise_on_error: if True, attach a response hook to raise on HTTP errors.
             added_headers: additional headers to include on the session.
+            cache: optional ``ResponseCache``; when set, repeat GETs send
+                ETag/Last-Modified validators and reuse the cached body
+                on ``304 Not Modified``.
+            skip_invalid_records: if True, `coerce_records` drops records that
+                fail validation instead of raising for the whole page.
+            rate_limiter: limiter acquired before every request. Pass a
+                shared instance to make several clients draw from one
+                budget; overrides ``limiter``.
+            limiter: default limiter kind when ``rate_limiter`` is not given:
+                ``"token"`` (5000/hour, bursts of 50) or ``"sliding"`` (never
+                more than 5000 in any rolling hour).
         """
         self.base_url = urljoin(ROOT_URL, api_version) + "/"
-        self._session = requests.Session()
+        # `_request_with_backoff` retries statuses within its total-wait bound
+        # and charges each retry to the rate limiter; urllib3 only retries
+        # connection errors here.
+        self._session = create_session_with_retries(status_forcelist=())
         self._session.headers.update({"User-Agent": "congress-tracker/1.0"})
         self._session.params = {"format": response_format}
         self._session.headers.update({"x-api-key": api_key})
@@ -115,12 +256,21 @@ class CDGClient:
                 )
             }
 
-        self._rate_limit_lock = threading.Lock()
-        self._rate_limit_last_call = 0.0
-        self._rate_limit_interval = 3600.0 / 5000.0
+        if rate_limiter is not None:
+            self._bucket = rate_limiter
+        elif limiter == "sliding":
+            self._bucket = SlidingWindowLimiter(DEFAULT_REQUESTS_PER_HOUR, 3600.0)
+        elif limiter == "token":
+            self._bucket = TokenBucket.per_hour(
+                DEFAULT_REQUESTS_PER_HOUR, capacity=DEFAULT_BURST
+            )
+        else:
+            raise ValueError(f"unknown limiter: {limiter!r}")
         # configurable retry total wait (seconds). If cumulative backoff
         # exceeds this, requests will raise a RuntimeError.
         self._max_total_retry_wait = 10.0
+        self._cache = cache
+        self.skip_invalid_records = skip_invalid_records
 
     @property
     def session(self) -> requests.Session:
@@ -134,40 +284,179 @@ class CDGClient:
 
         This explicit helper makes behavior clear and is easy to stub in tests.
         """
-        self._rate_limited()
         p = {k: str(v) for k, v in (params or {}).items()}
-        resp = self._request_with_backoff(
-            urljoin(self.base_url, endpoint), params=p, timeout=timeout
+        parsed = self._fetch_json(
+            self._endpoint_url(endpoint), params=p, timeout=timeout
         )
-        if not _is_json_response(resp):
-            raise ValueError("Non-JSON response received from Congress.gov API")
-        parsed = resp.json()
         if not isinstance(parsed, dict):
             raise ValueError("JSON response is not an object mapping")
         return parsed
 
+    def get_bytes(
+        self, endpoint: str, params: Mapping[str, Json] | None = None, timeout: int = 10
+    ) -> bytes:
+        """GET `endpoint` and return the raw JSON body without decoding it.
+
+        Rate limiting, retries and the JSON content-type check match
+        `get_json`; the response cache is bypassed because it stores
+        decoded bodies.
+        """
+        p = {k: str(v) for k, v in (params or {}).items()}
+        self._rate_limited()
+        resp = self._request_with_backoff(
+            self._endpoint_url(endpoint), params=p, timeout=timeout
+        )
+        if not _is_json_response(resp):
+            raise ValueError("Non-JSON response received from Congress.gov API")
+        return resp.content
+
+    def get_model(
+        self,
+        endpoint: str,
+        model_cls: type[ModelT],
+        params: Mapping[str, Json] | None = None,
+        timeout: int = 10,
+    ) -> ModelT:
+        """GET `endpoint` and validate the body straight into `model_cls`.
+
+        `model_validate_json` parses with pydantic-core's JSON parser in a
+        single pass, so no intermediate dict tree is built. Intended for
+        response wrappers such as `BillActionsResponse`.
+        """
+        return model_cls.model_validate_json(
+            self.get_bytes(endpoint, params=params, timeout=timeout)
+        )
+
+    def _endpoint_url(self, endpoint: str) -> str:
+        """Return the absolute URL for a relative `endpoint` such as ``bill/118``.
+
+        Plain concatenation onto the precomputed `base_url` avoids re-parsing
+        the base with `urljoin` on every request; absolute URLs and
+        root-relative paths keep `urljoin` semantics.
+        """
+        if endpoint.startswith(("http://", "https://", "/")):
+            return urljoin(self.base_url, endpoint)
+        return self.base_url + endpoint
+
     def request_for_spec(
-        self, spec: EndpointSpec, runtime_params: dict[str, Json], timeout: int = 10
+        self,
+        spec: EndpointSpec,
+        runtime_params: dict[str, Json],
+        timeout: int = 10,
+        extra_query: Mapping[str, Json] | None = None,
     ) -> Mapping[str, Json]:
         """Render path + query for `spec`, perform request, return JSON object mapping.
 
+        ``extra_query`` is merged over the spec-derived query; pagination
+        uses it to send offset/limit params that are not declared on the spec.
+
         Raises ValueError for non-JSON responses or unexpected JSON shapes.
         """
         spec.validate_params(runtime_params)
         url = spec.render_path(self.base_url, runtime_params)
         query = spec.build_query(runtime_params)
+        if extra_query:
+            query = {**query, **extra_query}
+
+        parsed = self._fetch_json(
+            url, params={k: str(v) for k, v in (query or {}).items()}, timeout=timeout
+        )
+        if not isinstance(parsed, dict):
+            raise ValueError("Unexpected JSON shape: expected object mapping")
+        return parsed
+
+    def _fetch_json(
+        self, url: str, params: Mapping[str, str], timeout: int = 10
+    ) -> Json:
+        """Rate-limit, GET `url`, enforce a JSON response and decode it.
+
+        When a response cache is configured, entries within its TTL are
+        returned without a request; otherwise stored ETag/Last-Modified
+        validators are sent and a ``304 Not Modified`` reuses the cached body.
+        """
+        key = entry = None
+        headers: dict[str, str] | None = None
+        if self._cache is not None:
+            key = self._cache.make_key(url, params)
+            entry = self._cache.get(key)
+            if entry is not None:
+                if self._cache.is_fresh(entry):
+                    return cast(Json, entry.body)
+                headers = entry.validator_headers()
 
         self._rate_limited()
         resp = self._request_with_backoff(
-            url, params={k: str(v) for k, v in (query or {}).items()}, timeout=timeout
+            url, params=params, timeout=timeout, headers=headers
         )
+        if entry is not None and getattr(resp, "status_code", None) == 304:
+            # Revalidated: restart the entry's TTL window.
+            entry.stored_at = time.time()
+            self._cache.touch(key, entry)
+            return cast(Json, entry.body)
         if not _is_json_response(resp):
             raise ValueError("Non-JSON response received from Congress.gov API")
-        parsed = resp.json()
-        if not isinstance(parsed, dict):
-            raise ValueError("Unexpected JSON shape: expected object mapping")
+        parsed = _decode_json(resp)
+        if self._cache is not None and key is not None:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified or self._cache.ttl is not None:
+                self._cache.set(
+                    key,
+                    CachedResponse(
+                        body=parsed, etag=etag, last_modified=last_modified
+                    ),
+                )
         return parsed
 
+    def fetch_text(
+        self,
+        url: str,
+        parse: Callable[[str], str] | None = None,
+        timeout: int = 30,
+    ) -> str:
+        """GET a document URL (e.g. formatted bill text) and return its text.
+
+        `parse`, when given, is applied to the response text (e.g. HTML to
+        plain text). With a response cache configured the *parsed* result is
+        stored with the response's ETag/Last-Modified, so a ``304 Not
+        Modified`` on later runs skips both the transfer and the re-parse.
+        These documents are not API calls, so the rate limiter is not used,
+        and they are fetched on the shared session so the API key and
+        ``format`` parameter are not sent to the document host.
+
+        Raises:
+            requests.HTTPError: if the document request fails.
+        """
+        key = entry = None
+        headers: dict[str, str] | None = None
+        if self._cache is not None:
+            # Cached text is the parser's output, so key it by parser too.
+            parser = f"{parse.__module__}.{parse.__qualname__}" if parse else "raw"
+            key = self._cache.make_key(f"text:{parser}:{url}")
+            entry = self._cache.get(key)
+            if entry is not None:
+                if self._cache.is_fresh(entry):
+                    return cast(str, entry.body)
+                headers = entry.validator_headers()
+
+        extra = {"headers": headers} if headers else {}
+        resp = get_shared_session().get(url, timeout=timeout, **extra)
+        if entry is not None and resp.status_code == 304:
+            entry.stored_at = time.time()
+            self._cache.touch(key, entry)
+            return cast(str, entry.body)
+        resp.raise_for_status()
+        text = parse(resp.text) if parse else resp.text
+        if self._cache is not None and key is not None and resp.status_code == 200:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified or self._cache.ttl is not None:
+                self._cache.set(
+                    key,
+                    CachedResponse(body=text, etag=etag, last_modified=last_modified),
+                )
+        return text
+
     def _request_with_backoff(
         self,
         url: str,
@@ -177,6 +466,7 @@ class CDGClient:
         base_delay: float = 0.5,
         max_delay: float = 10.0,
         max_attempts: int = 5,
+        headers: Mapping[str, str] | None = None,
     ) -> requests.Response:
         """Perform GET with exponential backoff. Raises RuntimeError if
         cumulative backoff exceeds `self._max_total_retry_wait`.
@@ -191,10 +481,16 @@ class CDGClient:
         """
         attempts = 0
         cumulative_sleep = 0.0
+        # Normalize params and request kwargs once, not on every retry.
+        req_params = {
+            k: v if isinstance(v, str) else str(v) for k, v in (params or {}).items()
+        }
+        extra = {"headers": headers} if headers else {}
         while True:
             try:
-                req_params = {k: str(v) for k, v in (params or {}).items()}
-                resp = self._session.get(url, params=req_params, timeout=timeout)
+                resp = self._session.get(
+                    url, params=req_params, timeout=timeout, **extra
+                )
                 # Treat 5xx as retryable when a real status_code is present.
                 if hasattr(resp, "status_code") and getattr(resp, "status_code") >= 500:
                     raise requests.HTTPError(
@@ -217,6 +513,8 @@ class CDGClient:
                 sleep_for = min(delay, remaining)
                 time.sleep(sleep_for)
                 cumulative_sleep += sleep_for
+                # Every retry is another request against the hourly budget.
+                self._rate_limited()
                 continue
 
     def iterate_pages(
@@ -227,6 +525,11 @@ class CDGClient:
         `spec.response_model` must be present and resolve to a Pydantic model
         class; otherwise this method raises `ValueError` to keep the API
         strongly typed.
+
+        Paginated specs are fetched lazily: each page is requested only when
+        the caller advances the iterator, so consumers that stop early never
+        pay for the remaining pages. The third tuple element carries the
+        page's ``offset``, ``limit``, ``next_offset`` and ``total``.
         """
         params: dict[str, Json] = dict(base_params or {})
         pagination = spec.pagination
@@ -244,6 +547,58 @@ class CDGClient:
             yield coerced, resp, {}
             return
 
+        if pagination.type not in (PaginationType.OFFSET, PaginationType.PAGE):
+            raise ValueError(f"unsupported pagination type: {pagination.type}")
+
+        offset, page_size = self._page_window(pagination, params)
+        while True:
+            page_query = self._page_query(pagination, offset, page_size)
+            resp = self.request_for_spec(spec, params, extra_query=page_query)
+            records = self._extract_records_from_response(spec, resp)
+            if not records:
+                return
+            coerced = self.coerce_records(model_cls, records)
+            meta = resolve_pagination(
+                dict(resp), records_len=len(records), offset=offset, page_size=page_size
+            )
+            yield coerced, resp, {
+                "offset": offset,
+                "limit": page_size,
+                "next_offset": meta.next_offset,
+                "total": meta.total,
+            }
+            if meta.next_offset == -1 or meta.next_offset <= offset:
+                return
+            offset = meta.next_offset
+
+    @staticmethod
+    def _page_window(
+        pagination: PaginationSpec, params: dict[str, Json]
+    ) -> tuple[int, int]:
+        """Pop the caller's offset/limit from `params`; return `(offset, page_size)`."""
+        page_size = _to_int(
+            params.pop(pagination.limit_param, None), pagination.default_limit or 250
+        )
+        if pagination.max_limit:
+            page_size = min(page_size, pagination.max_limit)
+        offset = _to_int(params.pop(pagination.offset_param, None), 0)
+        return offset, page_size
+
+    @staticmethod
+    def _page_query(
+        pagination: PaginationSpec, offset: int, page_size: int
+    ) -> dict[str, Json]:
+        """Return the query params selecting the page that starts at `offset`."""
+        if pagination.type == PaginationType.PAGE and pagination.page_param:
+            return {
+                pagination.page_param: offset // page_size + 1,
+                pagination.limit_param: page_size,
+            }
+        return {
+            pagination.offset_param: offset,
+            pagination.limit_param: page_size,
+        }
+
     def fetch_list(
         self, spec: EndpointSpec, params: Mapping[str, Json] | None = None
     ) -> list[BaseModel]:
@@ -280,86 +635,7 @@ class CDGClient:
         present on path/query params so calling code doesn't need resource-specific
         parsing logic.
         """
-        params: dict[str, Json] = {}
-        # accept either mapping or pydantic BaseModel
-        if isinstance(record, BaseModel):
-            mapping = record.model_dump()
-        elif isinstance(record, dict):
-            mapping = record
-        else:
-            try:
-                mapping = vars(record)
-            except Exception:
-                mapping = {}
-
-        def _resolve_source_field(
-            mapping: Mapping[str, Json] | list[Json] | None, source_field: str
-        ) -> Json | None:
-            """Resolve a dotted `source_field` path from a mapping or model dump.
-
-            Supports list-index segments like 'laws.0.type'. Returns `None` when
-            the path cannot be resolved.
-            """
-            # support dotted paths like 'laws.0.type'
-            parts = source_field.split(".") if source_field else []
-            v = mapping
-            for part in parts:
-                if v is None:
-                    return None
-                if isinstance(v, list):
-                    if part.isdigit():
-                        idx = int(part)
-                        v = v[idx] if 0 <= idx < len(v) else None
-                    else:
-                        return None
-                elif isinstance(v, dict):
-                    v = v.get(part)
-                else:
-                    return None
-            return v
-
-        for p in getattr(spec, "param_specs", []) or []:
-            if p.location == p.location.PATH or p.location == p.location.QUERY:
-                value: Json | None = None
-                if getattr(p, "source_field", None):
-                    value = _resolve_source_field(mapping, p.source_field)
-                    if value is None and p.source_field in mapping:
-                        value = mapping.get(p.source_field)
-
-                if value is None and getattr(p, "extract_from_url_segment", None):
-                    url = mapping.get("url")
-                    if url is not None:
-                        url_str = str(url)
-                        if f"/{p.extract_from_url_segment}/" in url_str:
-                            tail = url_str.split(f"/{p.extract_from_url_segment}/")[-1]
-                            value = tail.split("?")[0]
-
-                if value is not None:
-                    # Map law type strings like 'Public Law' -> 'pub'
-                    if p.name == "lawType" and isinstance(value, str):
-                        low = value.strip().lower()
-                        if "public" in low:
-                            value = "pub"
-                        elif "private" in low:
-                            value = "priv"
-                    # Normalize law number: strip optional congress prefix like '119-44' -> '44'
-                    if (
-                        p.name == "lawNumber"
-                        and isinstance(value, str)
-                        and "-" in value
-                    ):
-                        value = value.split("-", 1)[-1]
-                    # Normalize path parameter strings to lowercase so API slugs match,
-                    # but preserve original casing for id-like params (e.g., CRS report ids)
-                    if isinstance(value, str) and p.location == p.location.PATH:
-                        if p.name == "id":
-                            # Keep id casing as provided by the source record
-                            value = value
-                        else:
-                            value = value.lower()
-                    params[p.name] = value  # type: ignore[assignment]
-
-        return params
+        return _resolve_runtime_params(spec, record)
 
     def _resolve_response_model(self, spec: EndpointSpec) -> type[BaseModel]:
         """Resolve and return the Pydantic model class for `spec.response_model`.
@@ -400,11 +676,17 @@ class CDGClient:
         model_cls: type[BaseModel],
         records: list[dict[str, Json]],
         spec=None,
+        skip_invalid: bool | None = None,
     ) -> list[BaseModel]:
         """Coerce mapping records into instances of `model_cls`.
 
         Raises `ValueError` on validation failure to keep contract explicit.
+        When `skip_invalid` is true (defaulting to the client's
+        `skip_invalid_records`), records that fail validation are logged and
+        dropped individually so the rest of the page is kept.
         """
+        if skip_invalid is None:
+            skip_invalid = self.skip_invalid_records
         coerced: list[BaseModel] = []
         for r in records:
             if not isinstance(r, dict):
@@ -457,11 +739,36 @@ class CDGClient:
                 # structure is JSON-compatible but the recursive `Json` alias
                 # confuses some checkers when used directly.
                 r["notes"] = cast(Json, normalized_notes)
-            try:
-                inst = model_cls.model_validate(r)
-            except Exception as exc:  # validation error
+
+        # Validate the whole page in one call so the per-item work runs in
+        # pydantic-core rather than a Python-level loop.
+        adapter = list_adapter(model_cls)
+        try:
+            validated = adapter.validate_python(records)
+        except ValidationError as exc:
+            # List-adapter error locations start with the failing item index.
+            bad = sorted(
+                {
+                    e["loc"][0]
+                    for e in exc.errors()
+                    if e["loc"] and isinstance(e["loc"][0], int)
+                }
+            )
+            if not skip_invalid or not bad:
                 logger.exception("failed to validate record against %s", model_cls)
                 raise ValueError(f"failed to validate record: {exc}") from exc
+            logger.warning(
+                "skipped %d of %d invalid %s records at indexes %s: %s",
+                len(bad),
+                len(records),
+                model_cls.__name__,
+                bad,
+                exc,
+            )
+            bad_set = set(bad)
+            records = [r for i, r in enumerate(records) if i not in bad_set]
+            validated = adapter.validate_python(records)
+        for r, inst in zip(records, validated):
             # Allow model instances to provide their own canonical id via
             # a `build_id()` method. If the model exposes `build_id()` and
             # the instance has no truthy `id`, attempt to set it from the
@@ -513,13 +820,12 @@ class CDGClient:
             # represented by our Pydantic models. This helps detect
             # accidental data loss during validation/coercion.
             try:
-                original_keys = set(r.keys())
-                processed_dump = inst.model_dump(by_alias=True)
-                processed_keys = set(processed_dump.keys())
+                processed_keys = _exported_keys(type(inst))
                 # Common wrapper/aux keys that may legitimately be present
                 # in responses but not part of item models.
-                ignored_keys = {"value"}
-                unprocessed = original_keys - processed_keys - ignored_keys
+                unprocessed = r.keys() - processed_keys - {"value"}
+                if unprocessed and inst.model_extra:
+                    unprocessed -= inst.model_extra.keys()
                 if unprocessed:
                     msg = (
                         f"Unprocessed fields for {model_cls.__name__} id={r.get('id')}: "
@@ -587,18 +893,13 @@ class CDGClient:
         return []
 
     def _rate_limited(self) -> None:
-        """Enforce client-wide rate limiting between HTTP calls.
+        """Block until the client's rate limiter admits another request.
 
-        Uses a thread-safe lock and a per-call interval derived from the
-        configured rate limit settings. This method blocks the caller when
-        the last request occurred more recently than the allowed interval.
+        Unlike a fixed inter-request interval this only waits when the
+        budget is actually exhausted, so slow responses do not add further
+        sleeps and concurrent workers can burst up to the bucket capacity.
         """
-        with self._rate_limit_lock:
-            now = time.time()
-            elapsed = now - self._rate_limit_last_call
-            if elapsed < self._rate_limit_interval:
-                time.sleep(self._rate_limit_interval - elapsed)
-            self._rate_limit_last_call = time.time()
+        self._bucket.acquire()
 
 
 def get_client(api_key: str | None = None, **kwargs) -> CDGClient:
@@ -607,27 +908,76 @@ def get_client(api_key: str | None = None, **kwargs) -> CDGClient:
     If ``api_key`` is not provided the module-level ``CONGRESS_API_KEY`` is used.
     Additional keyword arguments are forwarded to the ``CDGClient``
     constructor.
+
+    Calls without extra keyword arguments share one client per API key, so
+    repeated callers reuse its connection pool and rate-limit state instead
+    of each opening a new session.
     """
     key = api_key or CONGRESS_API_KEY
-    return CDGClient(api_key=key, **kwargs)
+    if kwargs:
+        return CDGClient(api_key=key, **kwargs)
+    return _shared_client(key)
 
 
-def resolve_runtime_params_from_record(
-    client_obj: CDGClient, spec: EndpointSpec, record: BaseModel | Mapping[str, Json]
-) -> dict[str, Json]:
-    """Module-level helper to derive runtime params from a record.
+@functools.lru_cache(maxsize=None)
+def _shared_client(api_key: str) -> CDGClient:
+    """Return the process-wide default-configured client for ``api_key``."""
+    return CDGClient(api_key=api_key)
+
+
+def _model_value(model: BaseModel, name: str) -> Json | None:
+    """Return field `name` of `model` as `model_dump()` would key it, or None."""
+    if name in type(model).model_fields:
+        return getattr(model, name)
+    extra = model.__pydantic_extra__
+    if extra and name in extra:
+        return extra[name]
+    return None
+
 
-    Calls the instance method if present; otherwise falls back to the
-    same resolution logic so callers can import this function directly.
+def _resolve_source_field(
+    mapping: Mapping[str, Json] | list[Json] | BaseModel | None, source_field: str
+) -> Json | None:
+    """Resolve a dotted `source_field` path from a mapping or model instance.
+
+    Supports list-index segments like 'laws.0.type'. Model instances are
+    traversed by attribute so only the referenced fields are read. Returns
+    `None` when the path cannot be resolved.
     """
-    if hasattr(client_obj, "resolve_runtime_params_from_record"):
-        return client_obj.resolve_runtime_params_from_record(spec, record)
+    # support dotted paths like 'laws.0.type'
+    parts = source_field.split(".") if source_field else []
+    v = mapping
+    for part in parts:
+        if v is None:
+            return None
+        if isinstance(v, list):
+            if part.isdigit():
+                idx = int(part)
+                v = v[idx] if 0 <= idx < len(v) else None
+            else:
+                return None
+        elif isinstance(v, dict):
+            v = v.get(part)
+        elif isinstance(v, BaseModel):
+            v = _model_value(v, part)
+        else:
+            return None
+    return v
 
-    # Fallback implementation (mirrors the instance method)
+
+def _resolve_runtime_params(
+    spec: EndpointSpec, record: BaseModel | Mapping[str, Json]
+) -> dict[str, Json]:
+    """Derive runtime params for `spec` from a list-item record.
+
+    Shared implementation behind `CDGClient.resolve_runtime_params_from_record`
+    and the module-level helper of the same name.
+    """
     params: dict[str, Json] = {}
-    if isinstance(record, BaseModel):
-        mapping = record.model_dump()
-    elif isinstance(record, dict):
+    # accept either mapping or pydantic BaseModel; models are read field by
+    # field rather than dumped wholesale, since only a few params are needed
+    mapping: Mapping[str, Json] | BaseModel
+    if isinstance(record, (BaseModel, dict)):
         mapping = record
     else:
         try:
@@ -635,18 +985,27 @@ def resolve_runtime_params_from_record(
         except Exception:
             mapping = {}
 
+    def _top_level(name: str) -> Json | None:
+        if isinstance(mapping, BaseModel):
+            return _model_value(mapping, name)
+        return mapping.get(name)
+
     for p in getattr(spec, "param_specs", []) or []:
         if p.location == p.location.PATH or p.location == p.location.QUERY:
-            value = None
-            if getattr(p, "source_field", None) and p.source_field in mapping:
-                value = mapping.get(p.source_field)
+            value: Json | None = None
+            if getattr(p, "source_field", None):
+                value = _resolve_source_field(mapping, p.source_field)
+                if value is None:
+                    value = _top_level(p.source_field)
+
             if value is None and getattr(p, "extract_from_url_segment", None):
-                url = mapping.get("url")
+                url = _top_level("url")
                 if url is not None:
                     url_str = str(url)
                     if f"/{p.extract_from_url_segment}/" in url_str:
                         tail = url_str.split(f"/{p.extract_from_url_segment}/")[-1]
                         value = tail.split("?")[0]
+
             if value is not None:
                 # Map law type strings like 'Public Law' -> 'pub'
                 if p.name == "lawType" and isinstance(value, str):
@@ -658,8 +1017,28 @@ def resolve_runtime_params_from_record(
                 # Normalize law number: strip optional congress prefix like '119-44' -> '44'
                 if p.name == "lawNumber" and isinstance(value, str) and "-" in value:
                     value = value.split("-", 1)[-1]
-                # Normalize path parameter strings to lowercase so API slugs match
+                # Normalize path parameter strings to lowercase so API slugs match,
+                # but preserve original casing for id-like params (e.g., CRS report ids)
                 if isinstance(value, str) and p.location == p.location.PATH:
-                    value = value.lower()
-                params[p.name] = value
+                    if p.name == "id":
+                        # Keep id casing as provided by the source record
+                        value = value
+                    else:
+                        value = value.lower()
+                params[p.name] = value  # type: ignore[assignment]
+
     return params
+
+
+def resolve_runtime_params_from_record(
+    client_obj: CDGClient, spec: EndpointSpec, record: BaseModel | Mapping[str, Json]
+) -> dict[str, Json]:
+    """Module-level helper to derive runtime params from a record.
+
+    Calls the instance method if present; otherwise uses the shared
+    resolution logic directly so callers can import this function.
+    """
+    if hasattr(client_obj, "resolve_runtime_params_from_record"):
+        return client_obj.resolve_runtime_params_from_record(spec, record)
+
+    return _resolve_runtime_params(spec, record)
@@ -9,13 +9,29 @@ This module provides helpers to:
 from __future__ import annotations
 
 import json
+import os
 import time
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, MutableMapping, Optional, TypeAlias, Union
-
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sized,
+    TypeAlias,
+    Union,
+)
+
+import orjson
 from tqdm import tqdm
 
-from src.data_collection.utils import extract_offset, resolve_pagination_wait
+from src.data_collection.utils import (
+    append_jsonl,
+    infer_next_offset,
+    resolve_pagination_wait,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +43,87 @@ Json: TypeAlias = Union[str, int, float, bool, None, list["Json"], Mapping[str,
 ListFetcher = Callable[[int, int], Mapping[str, Json]]
 DetailFetcher = Callable[[Mapping[str, Json]], Mapping[str, Json]]
 IdGetter = Callable[[Mapping[str, Json]], str]
+VersionGetter = Callable[[Mapping[str, Json]], Optional[str]]
+
+
+def update_date_version(item: Mapping[str, Json]) -> Optional[str]:
+    """Return the list item's update stamp for use as an enrichment version.
+
+    Prefers ``updateDateIncludingText`` (bills change when text is added)
+    and falls back to ``updateDate``.
+    """
+    value = item.get("updateDateIncludingText") or item.get("updateDate")
+    return str(value) if value else None
+
+
+def _iter_records(path: Path) -> Iterator[Mapping[str, Json]]:
+    """Yield records persisted by :func:`_append_records` one line at a time.
+
+    Results files are JSON Lines (one record per line), so large files are
+    streamed instead of being read into memory whole. Files written by
+    earlier versions as a single JSON array are still accepted.
+    """
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if line.lstrip().startswith(b"["):
+                yield from orjson.loads(line + f.read())
+                return
+            yield orjson.loads(line)
+
+
+def _read_records(path: Path) -> list[Mapping[str, Json]]:
+    """Load every record persisted by :func:`_append_records` into a list."""
+    return list(_iter_records(path))
+
+
+def _append_records(path: Path, records: Iterable[Mapping[str, Json]]) -> None:
+    """Append ``records`` to ``path`` as JSON Lines.
+
+    Only the new batch is serialized, so each checkpoint costs O(batch)
+    rather than re-writing every record collected so far.
+    """
+    append_jsonl(path, records)
+
+
+def _is_legacy_results(path: Path) -> bool:
+    """Return True if ``path`` holds a legacy JSON array rather than JSON Lines.
+
+    Only the leading whitespace and the first significant byte are read.
+    """
+    with path.open("rb") as f:
+        while chunk := f.read(4096):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped.startswith(b"[")
+    return False
+
+
+def _rewrite_records(path: Path, records: Iterable[Mapping[str, Json]]) -> None:
+    """Replace ``path`` with ``records`` as JSON Lines.
+
+    The records are written to a sibling temporary file that is then moved
+    over ``path``, so a failure part-way leaves the previous file intact.
+    """
+    tmp = path.with_name(f"{path.name}.tmp")
+    # Discard a leftover from an interrupted rewrite before appending.
+    tmp.unlink(missing_ok=True)
+    try:
+        append_jsonl(tmp, records)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _migrate_legacy_results(path: Path) -> None:
+    """Rewrite a legacy JSON-array results file as JSON Lines in place.
+
+    JSON Lines files are left untouched without being read, since new pages
+    are appended to them as they arrive.
+    """
+    if path.exists() and _is_legacy_results(path):
+        _rewrite_records(path, _read_records(path))
 
 
 def retry_call(
@@ -69,7 +166,8 @@ def collect_paginated_list(
 
     This helper repeatedly calls ``fetch_page(offset, page_size)`` until no more
     items are returned. Progress can be saved to ``results_path`` and
-    ``checkpoint_path`` so collection can be resumed.
+    ``checkpoint_path`` so collection can be resumed. Results are appended
+    to ``results_path`` as JSON Lines, one page at a time.
     """
     offset = 0
     records: list[Mapping[str, Json]] = []
@@ -78,7 +176,8 @@ def collect_paginated_list(
             "offset", 0
         )
     if results_path and results_path.exists():
-        records = json.loads(results_path.read_text(encoding="utf-8"))
+        _migrate_legacy_results(results_path)
+        records = _read_records(results_path)
 
     wait_val = resolve_pagination_wait(page_size, wait)
     pbar = tqdm(desc=f"Collecting {data_key}", unit="item")
@@ -96,13 +195,13 @@ def collect_paginated_list(
         next_url = pagination.get("next") if isinstance(pagination, Mapping) else None
         if not next_url:
             break
-        new_offset = extract_offset(next_url)
+        new_offset = infer_next_offset(next_url, offset, len(page_records))
         if new_offset == offset:
             break
         offset = new_offset
 
         if results_path:
-            results_path.write_text(json.dumps(records), encoding="utf-8")
+            _append_records(results_path, page_records)
         if checkpoint_path:
             checkpoint_path.write_text(json.dumps({"offset": offset}), encoding="utf-8")
         time.sleep(wait_val)
@@ -120,6 +219,7 @@ def enrich_records(
     results_path: Optional[Path] = None,
     retries: int = 3,
     backoff: float = 0.5,
+    version_getter: Optional[VersionGetter] = None,
 ) -> list[Mapping[str, Json]]:
     """Fetch detail records for each item and checkpoint progress.
 
@@ -131,47 +231,70 @@ def enrich_records(
         results_path: optional Path to save enriched records as they are produced.
         retries: retry attempts for individual detail fetches.
         backoff: base backoff seconds between retries.
+        version_getter: optional callable returning a change stamp for a
+            list item (e.g. :func:`update_date_version`). The stamp is saved
+            as ``_version``; on later runs a completed record is re-fetched
+            only when its stamp changed, so incremental runs skip unchanged
+            items without any request.
 
     Returns:
         List of enriched detail mappings, each including an ``_id`` key.
     """
     enriched: MutableMapping[str, Mapping[str, Json]] = {}
     completed_ids: set[str] = set()
+    superseded = False
 
     if results_path and results_path.exists():
-        enriched = {
-            r["_id"]: r for r in json.loads(results_path.read_text(encoding="utf-8"))
-        }
+        _migrate_legacy_results(results_path)
+        loaded = 0
+        for r in _iter_records(results_path):
+            # Later lines supersede earlier ones with the same id.
+            enriched[r["_id"]] = r
+            loaded += 1
         completed_ids = set(enriched.keys())
+        superseded = loaded > len(enriched)
     if checkpoint_path and checkpoint_path.exists():
         completed_ids.update(
             json.loads(checkpoint_path.read_text(encoding="utf-8")).get("completed", [])
         )
 
-    items_list = list(items)
-    pbar = tqdm(total=len(items_list), desc="Enriching records", unit="item")
+    # Only size the progress bar when the input already knows its length;
+    # generators are consumed lazily instead of being materialized.
+    total = len(items) if isinstance(items, Sized) else None
+    pbar = tqdm(total=total, desc="Enriching records", unit="item")
     pbar.update(len(completed_ids))
 
-    for item in items_list:
+    for item in items:
         record_id = id_getter(item)
+        version = version_getter(item) if version_getter else None
         if record_id in completed_ids:
-            continue
+            stored = enriched.get(record_id)
+            # Ids known only from the checkpoint carry no stamp; keep them.
+            if version is None or stored is None or stored.get("_version") == version:
+                continue
 
         detail = retry_call(lambda: detail_fetcher(item), retries=retries, backoff=backoff)
-        enriched[record_id] = {"_id": record_id, **detail}
-        completed_ids.add(record_id)
-        pbar.update(1)
+        record: dict[str, Json] = {"_id": record_id, **detail}
+        if version is not None:
+            record["_version"] = version
+        superseded = superseded or record_id in enriched
+        enriched[record_id] = record
+        if record_id not in completed_ids:
+            completed_ids.add(record_id)
+            pbar.update(1)
 
         if results_path:
-            results_path.write_text(
-                json.dumps(list(enriched.values())), encoding="utf-8"
-            )
+            _append_records(results_path, [enriched[record_id]])
         if checkpoint_path:
             checkpoint_path.write_text(
                 json.dumps({"completed": sorted(completed_ids)}), encoding="utf-8"
             )
 
     pbar.close()
+    if results_path and superseded:
+        # Re-fetched records were appended after their stale copies; keep
+        # only the latest line per id so the file does not grow every run.
+        _rewrite_records(results_path, enriched.values())
     return list(enriched.values())
 
 
@@ -189,6 +312,7 @@ def collect_with_details(
     detail_results: Optional[Path] = None,
     retries: int = 3,
     backoff: float = 0.5,
+    version_getter: Optional[VersionGetter] = None,
 ) -> list[Mapping[str, Json]]:
     """Collect list items and enrich them with detail records.
 
@@ -211,4 +335,5 @@ def collect_with_details(
         results_path=detail_results,
         retries=retries,
         backoff=backoff,
+        version_getter=version_getter,
     )
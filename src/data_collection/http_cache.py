@@ -0,0 +1,203 @@
+"""Conditional-GET response cache for Congress.gov API reads.
+
+Entries keep the JSON body together with the ``ETag`` and
+``Last-Modified`` validators the server returned; bodies are stored encoded
+and every read decodes a fresh copy, so callers may mutate what they get. On a repeat request the
+client sends ``If-None-Match`` / ``If-Modified-Since``; a ``304 Not
+Modified`` answer then reuses the cached body without transferring or
+parsing it again. With a ``ttl`` configured, entries younger than the TTL
+are served without any HTTP request at all.
+
+``ResponseCache`` lives in memory for one process; ``SqliteResponseCache``
+persists entries in a SQLite file so repeat collection runs start warm.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Mapping, cast
+
+import orjson
+
+
+@dataclass
+class CachedResponse:
+    """A decoded response body and the validators needed to revalidate it."""
+
+    body: object
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = field(default_factory=time.time)
+
+    def validator_headers(self) -> dict[str, str]:
+        """Return the conditional request headers for this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Thread-safe in-memory LRU of :class:`CachedResponse` entries."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before the least
+                recently used one is evicted.
+            ttl: Seconds an entry is considered fresh and served without
+                revalidation. ``None`` always revalidates.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Mapping[str, str] | None = None) -> str:
+        """Build a stable cache key for ``url`` and its query ``params``."""
+        if not params:
+            return url
+        query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"{url}?{query}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the entry for ``key`` or None, marking it recently used.
+
+        The body is decoded afresh on every call, so mutating a returned
+        body (as `coerce_records` does with ``notes``) never changes what
+        later reads see.
+        """
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            self._entries.move_to_end(key)
+        return replace(stored, body=orjson.loads(cast(bytes, stored.body)))
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Return True when ``entry`` is within the TTL and needs no request."""
+        return self.ttl is not None and time.time() - entry.stored_at < self.ttl
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store ``entry`` under ``key``, evicting the oldest entry if full."""
+        stored = replace(entry, body=orjson.dumps(entry.body))
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def touch(self, key: str, entry: CachedResponse) -> None:
+        """Record that ``entry`` was revalidated by copying its ``stored_at``."""
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None:
+                stored.stored_at = entry.stored_at
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteResponseCache(ResponseCache):
+    """:class:`ResponseCache` persisted to a SQLite database file.
+
+    Bodies are stored as orjson-encoded bytes. Entries survive across
+    processes, so validators from a previous run still yield ``304``
+    responses (and TTL hits) on the next one.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "congress_cache.sqlite",
+        max_entries: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Open (creating if needed) the cache database at ``path``.
+
+        Args:
+            path: SQLite database file.
+            max_entries: Optional cap; the oldest stored entries are removed
+                beyond it. ``None`` keeps every entry.
+            ttl: Seconds an entry is served without revalidation.
+        """
+        super().__init__(max_entries=max_entries or 0, ttl=ttl)
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode NORMAL only syncs at checkpoints; a crash can lose
+            # the last few cache writes, which merely costs a refetch.
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+                "last_modified TEXT, stored_at REAL NOT NULL)"
+            )
+            # Serves the ORDER BY stored_at pruning query in `set`.
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_responses_stored_at "
+                "ON responses (stored_at)"
+            )
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored entry for ``key`` or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, stored_at = row
+        return CachedResponse(
+            body=orjson.loads(body),
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+        )
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Insert or replace ``entry`` under ``key``."""
+        body = orjson.dumps(entry.body)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, etag, last_modified, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, body, entry.etag, entry.last_modified, entry.stored_at),
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def touch(self, key: str, entry: CachedResponse) -> None:
+        """Persist a revalidated entry's refreshed ``stored_at``."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?",
+                (entry.stored_at, key),
+            )
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
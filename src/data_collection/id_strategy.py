@@ -19,18 +19,25 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _model_attr(model: BaseModel, name: str):
+    """Return field or extra `name` of `model` as `model_dump()` would key it."""
+    if name in type(model).model_fields:
+        return getattr(model, name)
+    extra = model.__pydantic_extra__
+    if extra:
+        return extra.get(name)
+    return None
+
+
 def _resolve_path(mapping: Mapping[str, Any] | BaseModel | None, path: str):
-    """Resolve a dotted path (supports list indices) from a mapping or model."""
+    """Resolve a dotted path (supports list indices) from a mapping or model.
+
+    Models are traversed by attribute so only the referenced sub-object is
+    dumped, not the whole instance; the result matches resolving the path
+    against ``model_dump()``.
+    """
     if mapping is None or not path:
         return None
-    if isinstance(mapping, BaseModel):
-        try:
-            mapping = mapping.model_dump()
-        except Exception:
-            try:
-                mapping = vars(mapping)
-            except Exception:
-                mapping = {}
 
     parts = path.split(".")
     v = mapping
@@ -48,8 +55,14 @@ def _resolve_path(mapping: Mapping[str, Any] | BaseModel | None, path: str):
                 return None
         elif isinstance(v, dict):
             v = v.get(part)
+        elif isinstance(v, BaseModel):
+            v = _model_attr(v, part)
         else:
             return None
+    if isinstance(v, BaseModel):
+        return v.model_dump()
+    if isinstance(v, list) and any(isinstance(x, BaseModel) for x in v):
+        return [x.model_dump() if isinstance(x, BaseModel) else x for x in v]
     return v
 
 
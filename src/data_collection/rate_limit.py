@@ -0,0 +1,206 @@
+"""Thread-safe request rate limiting for Congress.gov API calls.
+
+The Congress.gov API allows 5000 requests per hour per key. A single
+token bucket shared by every worker keeps concurrent pagination and
+detail fetches under that budget without wall-clock bookkeeping in the
+callers. `SlidingWindowLimiter` is a stricter alternative that never
+admits more than the cap within any window, at the cost of keeping one
+timestamp per admitted request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class TokenBucket:
+    """Token-bucket limiter that refills continuously at ``rate`` tokens/second.
+
+    Up to ``capacity`` tokens may accumulate, allowing short bursts; the
+    long-run throughput never exceeds ``rate``.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens the bucket can hold.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_hour(cls, requests_per_hour: int, capacity: float = 1.0) -> "TokenBucket":
+        """Return a bucket that admits ``requests_per_hour`` on average."""
+        return cls(requests_per_hour / 3600.0, capacity)
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update. Caller holds the lock."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` if available.
+
+        Returns:
+            0.0 when the tokens were taken, otherwise the number of seconds
+            to wait before they will be available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` can be taken from the bucket."""
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Await until ``tokens`` can be taken, without blocking the event loop."""
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+
+class SlidingWindowLimiter:
+    """Limiter admitting at most ``max_requests`` in any ``window`` seconds.
+
+    Timestamps of admitted requests are kept in a deque; a request waits
+    until the oldest one leaves the window. Unlike :class:`TokenBucket`
+    this cannot exceed the cap over any window, even right after start-up.
+    Exposes the same ``try_acquire``/``acquire``/``acquire_async`` methods.
+    """
+
+    def __init__(self, max_requests: int = 5000, window: float = 3600.0) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_requests: Requests admitted per window.
+            window: Window length in seconds.
+        """
+        if max_requests < 1:
+            raise ValueError("max_requests must be at least 1")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.max_requests = max_requests
+        self.window = window
+        self._stamps: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Admit ``tokens`` requests if the window has room.
+
+        Returns:
+            0.0 when admitted, otherwise the seconds until room frees up.
+        """
+        n = int(tokens)
+        if n > self.max_requests:
+            raise ValueError("cannot acquire more than max_requests at once")
+        with self._lock:
+            now = time.monotonic()
+            horizon = now - self.window
+            stamps = self._stamps
+            while stamps and stamps[0] <= horizon:
+                stamps.popleft()
+            free = self.max_requests - len(stamps)
+            if free >= n:
+                stamps.extend([now] * n)
+                return 0.0
+            return stamps[n - free - 1] - horizon
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` requests are admitted."""
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Await admission of ``tokens`` requests without blocking the event loop."""
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+
+RateLimiter = TokenBucket | SlidingWindowLimiter
+
+
+class AdaptiveConcurrency:
+    """Async concurrency gate whose limit adapts with AIMD.
+
+    Use as ``async with gate:`` around each request. Call
+    :meth:`on_success` after a successful response to grow the limit by
+    roughly one slot per window of successes (additive increase) and
+    :meth:`on_throttle` after a 429 to halve it (multiplicative decrease).
+    The gate then converges on the highest concurrency the server
+    tolerates instead of a hard-coded value.
+    """
+
+    def __init__(
+        self, initial: int = 4, max_limit: int = 20, min_limit: int = 1
+    ) -> None:
+        """Initialize the gate.
+
+        Args:
+            initial: Starting number of concurrent slots.
+            max_limit: Upper bound for the limit.
+            min_limit: Lower bound for the limit.
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("require 1 <= min_limit <= initial <= max_limit")
+        self.limit = float(initial)
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of holders currently inside the gate."""
+        return self._in_flight
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        """Wait for a free slot under the current limit."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Release the slot and wake waiters."""
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        """Additively increase the limit after a successful response."""
+        self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+
+    def on_throttle(self) -> None:
+        """Halve the limit after the server signalled throttling."""
+        self.limit = max(float(self.min_limit), self.limit / 2.0)
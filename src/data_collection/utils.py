@@ -2,29 +2,55 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
+import shutil
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from math import ceil
-from typing import Callable, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import urlparse
 
+import orjson
 from pydantic import HttpUrl
 from requests.exceptions import ChunkedEncodingError
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.webdriver import WebDriver as Chrome
 from tqdm import tqdm
 from urllib3.exceptions import ProtocolError
 
 from src.data_collection.id_utils import parse_url_to_id
+from src.data_collection.rate_limit import TokenBucket
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 RESULT_LIMIT = 100
 RATE_LIMIT_CONSTANT = 5000 / 60 / 60  # 5000 requests per hour, divided into seconds
+_OFFSET_RE = re.compile(r"[?&]offset=(\d+)")
+# Shared across threads so concurrent callers stay under the hourly budget.
+API_RATE_LIMITER = TokenBucket(RATE_LIMIT_CONSTANT, capacity=5)
+# Browser-like headers for retrying a PDF GET that was refused with a 403.
+PDF_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "application/pdf,*/*;q=0.8",
+    "Referer": "https://www.congress.gov/",
+}
+
+
+def append_jsonl(path: str | os.PathLike, records: Iterable) -> None:
+    """Append ``records`` to ``path`` as JSON Lines serialized with orjson."""
+    with open(path, "ab") as f:
+        for record in records:
+            f.write(orjson.dumps(record))
+            f.write(b"\n")
 
 
 def checkpointed_paginate(
@@ -53,23 +79,24 @@ def checkpointed_paginate(
         *args, **kwargs: Forwarded to ``endpoint_func``.
 
     Returns:
-        None. Results are persisted to files named ``<func>_results.json`` and
-        checkpointed state is written to ``<func>_checkpoint.json``.
+        None. Each page is appended to ``<func>_results.jsonl`` as it arrives
+        (one record per line) and checkpointed state is written to
+        ``<func>_checkpoint.json``; memory stays bounded to one page.
     """
     func_name = endpoint_func.__name__
     checkpoint_file = f"{func_name}_checkpoint.json"
-    results_file = f"{func_name}_results.json"
+    results_file = f"{func_name}_results.jsonl"
+    legacy_results_file = f"{func_name}_results.json"
     offset = start_offset
     try:
         with open(checkpoint_file, "r", encoding="utf-8") as f:
             offset = json.load(f)["offset"]
     except FileNotFoundError:
         pass
-    try:
-        with open(results_file, "r", encoding="utf-8") as f:
-            all_results = json.load(f)
-    except FileNotFoundError:
-        all_results = []
+    if os.path.exists(legacy_results_file) and not os.path.exists(results_file):
+        # Carry results from the older single-array format over once.
+        with open(legacy_results_file, "rb") as f:
+            append_jsonl(results_file, orjson.loads(f.read()))
     while offset != -1:
         for attempt in range(max_retries):
             try:
@@ -86,25 +113,60 @@ def checkpointed_paginate(
                 time.sleep(2)
         else:
             break
-        all_results.extend(results)
-        with open(results_file, "w", encoding="utf-8") as f:
-            json.dump(all_results, f)
+        append_jsonl(results_file, results)
         with open(checkpoint_file, "w", encoding="utf-8") as f:
             json.dump({"offset": next_offset}, f)
         offset = next_offset
 
 
+@functools.lru_cache(maxsize=256)
 def datetime_convert(date_str: str) -> str:
-    """Convert a YYYY-MM-DD date to YYYY-MM-DDTHH:MM:SSZ."""
+    """Convert a YYYY-MM-DD date to YYYY-MM-DDTHH:MM:SSZ.
+
+    Inputs already in the target format are returned unchanged, and results
+    are memoized since callers convert the same few dates on every page.
+    """
+    if len(date_str) == 20 and date_str.endswith("Z") and date_str[10] == "T":
+        return date_str
     date_obj = datetime.strptime(date_str, "%Y-%m-%d")
     return date_obj.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def extract_offset(url: str) -> int:
-    """Extract the pagination offset from a URL query string."""
-    parsed_url = urlparse(url)
-    offset = parse_qs(parsed_url.query).get("offset", [0])[0]
-    return int(offset)
+    """Extract the pagination offset from a URL query string (0 when absent)."""
+    match = _OFFSET_RE.search(url)
+    return int(match.group(1)) if match else 0
+
+
+def _url_has_param(url: str, name: str, value: int) -> bool:
+    """Return True if ``url`` carries the exact query pair ``name=value``."""
+    token = f"{name}={value}"
+    i = url.find(token)
+    while i != -1:
+        end = i + len(token)
+        if (i == 0 or url[i - 1] in "?&") and (end == len(url) or url[end] in "&#"):
+            return True
+        i = url.find(token, i + 1)
+    return False
+
+
+def infer_next_offset(next_url: str, offset: int, records_len: int) -> int:
+    """Return the offset encoded in ``next_url``, skipping a full parse when possible.
+
+    Offset pagination normally advances by the number of records just
+    received, so that value is confirmed with a substring check and the
+    URL is only parsed when the API diverged from it.
+    """
+    expected = offset + records_len
+    if _url_has_param(next_url, "offset", expected):
+        return expected
+    return extract_offset(next_url)
+
+
+@functools.lru_cache(maxsize=64)
+def _query_param_re(name: str) -> re.Pattern[str]:
+    """Return a compiled pattern capturing the first ``name=`` query value."""
+    return re.compile(rf"[?&]{re.escape(name)}=([^&#]*)")
 
 
 def _extract_query_int(url: str, keys: tuple[str, ...]) -> Optional[int]:
@@ -118,13 +180,12 @@ def _extract_query_int(url: str, keys: tuple[str, ...]) -> Optional[int]:
         The integer value of the first matching query parameter, or ``None``
         when no integer value could be parsed.
     """
-    parsed_url = urlparse(url)
-    params = parse_qs(parsed_url.query)
     for key in keys:
-        if key in params and params[key]:
+        match = _query_param_re(key).search(url)
+        if match and match.group(1):
             try:
-                return int(params[key][0])
-            except (TypeError, ValueError):
+                return int(match.group(1))
+            except ValueError:
                 return None
     return None
 
@@ -204,14 +265,22 @@ def resolve_pagination(
         next_offset = -1
         next_url = pagination.get("next") or pagination.get("nextPage")
         if isinstance(next_url, str):
-            extracted = extract_offset_from_url(
-                next_url,
-                offset_param_names=offset_param_names,
-                page_param_names=page_param_names,
-                page_size=effective_page_size or page_size,
-            )
-            if extracted is not None:
-                next_offset = extracted
+            # Offset pagination normally advances by the records just
+            # received; confirm that cheaply before parsing the URL.
+            expected = offset + records_len
+            if "offset" in offset_param_names and _url_has_param(
+                next_url, "offset", expected
+            ):
+                next_offset = expected
+            else:
+                extracted = extract_offset_from_url(
+                    next_url,
+                    offset_param_names=offset_param_names,
+                    page_param_names=page_param_names,
+                    page_size=effective_page_size or page_size,
+                )
+                if extracted is not None:
+                    next_offset = extracted
         else:
             offset_value = pagination.get("offset")
             if offset_value is not None:
@@ -248,17 +317,6 @@ def resolve_pagination(
     )
 
 
-def determine_pagination_wait(start_time: float, offset: int) -> None:
-    """Sleep as needed to respect the hourly request rate limit."""
-    current_time = time.time()
-    elapsed_time = current_time - start_time
-    requests = max(RESULT_LIMIT, offset) / RESULT_LIMIT
-    rate = elapsed_time / requests
-    if rate < RATE_LIMIT_CONSTANT:
-        wait_time = RATE_LIMIT_CONSTANT - rate
-        time.sleep(wait_time)
-
-
 def resolve_pagination_wait(page_size: int, wait: Optional[float] = None) -> float:
     """Resolve the delay between paginated requests."""
     if wait is not None:
@@ -266,16 +324,6 @@ def resolve_pagination_wait(page_size: int, wait: Optional[float] = None) -> flo
     return 0.5
 
 
-def determine_simple_wait(start_time: float, api_call_count: int) -> None:
-    """Sleep as needed to respect the hourly request rate limit."""
-    current_time = time.time()
-    elapsed_time = current_time - start_time
-    rate = elapsed_time / api_call_count
-    if rate < RATE_LIMIT_CONSTANT:
-        wait_time = RATE_LIMIT_CONSTANT - rate
-        time.sleep(wait_time)
-
-
 def resolve_offset_limit(
     meta: dict | None, *, default_offset: int = 0, default_limit: int = 250
 ) -> tuple[int, int]:
@@ -314,6 +362,18 @@ def gather_paginated_metadata(
     return result.records
 
 
+def _update_page_progress(
+    pbar: tqdm, progress_mode: str, page_index: int, total_pages: int, records: list
+) -> None:
+    """Advance ``pbar`` for one fetched page according to ``progress_mode``."""
+    if progress_mode == "page":
+        pbar.update(1)
+        if total_pages:
+            pbar.set_postfix_str(f"{page_index}/{total_pages}")
+    else:
+        pbar.update(len(records))
+
+
 def gather_paginated_records(
     fetch_page: Callable[[int, int], dict],
     *,
@@ -327,6 +387,8 @@ def gather_paginated_records(
     offset_param_names: tuple[str, ...] = ("offset", "start", "skip"),
     page_param_names: tuple[str, ...] = ("page", "pageNumber", "page_number"),
     start_offset: int = 0,
+    max_workers: int = 1,
+    sink: Optional[Callable[[list], None]] = None,
 ) -> PaginatedFetchResult:
     """Aggregate list results across paginated endpoint responses.
 
@@ -348,12 +410,21 @@ def gather_paginated_records(
         offset_param_names: Alternative offset parameter names to recognize.
         page_param_names: Alternative page parameter names to recognize.
         start_offset: Starting offset for pagination.
+        max_workers: When greater than 1 and the first response reports a
+            total count, the remaining offsets are fetched concurrently on a
+            bounded thread pool. ``fetch_page`` must then be thread-safe and
+            is responsible for rate limiting (``CDGClient`` already is).
+        sink: Optional callable receiving each page's records in order. When
+            given, records are handed off page by page instead of being
+            accumulated, keeping peak memory at one page; the returned
+            ``records`` list is then empty.
 
     Returns:
         A ``PaginatedFetchResult`` with aggregated records and metadata.
     """
     offset = start_offset
     all_records: list = []
+    emit = sink or all_records.extend
     wait_val = resolve_pagination_wait(page_size, wait)
     pbar = tqdm(desc=desc, unit=unit)
     total = 0
@@ -365,7 +436,7 @@ def gather_paginated_records(
         records = response.get(str(data_key), [])
         if not records:
             break
-        all_records.extend(records)
+        emit(records)
         meta = resolve_pagination(
             response,
             records_len=len(records),
@@ -376,7 +447,9 @@ def gather_paginated_records(
         )
         if total == 0 and meta.total:
             total = meta.total
-            effective_page_size = meta.page_size or len(records) or page_size
+            # A server that caps the page size returns fewer records than
+            # were requested (or than its ``limit`` echoes); step by that.
+            effective_page_size = min(meta.page_size or page_size, len(records))
             total_pages = (
                 ceil(total / effective_page_size) if effective_page_size else 0
             )
@@ -384,16 +457,55 @@ def gather_paginated_records(
                 pbar.total = total_pages
                 pbar.refresh()
         page_index += 1
-        if progress_mode == "page":
-            pbar.update(1)
-            if total_pages:
-                pbar.set_postfix_str(f"{page_index}/{total_pages}")
-        else:
-            pbar.update(len(records))
+        _update_page_progress(pbar, progress_mode, page_index, total_pages, records)
         if on_progress:
             on_progress(offset, page_index, total_pages, effective_page_size)
         if meta.next_offset == -1 or meta.next_offset == offset:
             break
+        if max_workers > 1 and total and effective_page_size:
+            # Step and request with the page size the server actually uses,
+            # so a capped page size neither overlaps nor skips records.
+            offsets = iter(range(meta.next_offset, total, effective_page_size))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Keep at most ``max_workers`` pages in flight and consume
+                # them in submission order, so records keep the same ordering
+                # as the sequential path and an early end wastes few requests.
+                window: deque[tuple[int, Future]] = deque(
+                    (o, executor.submit(fetch_page, o, effective_page_size))
+                    for o in islice(offsets, max_workers)
+                )
+                while window:
+                    page_offset, future = window.popleft()
+                    page_records = future.result().get(str(data_key), [])
+                    if page_records:
+                        emit(page_records)
+                        page_index += 1
+                        _update_page_progress(
+                            pbar, progress_mode, page_index, total_pages, page_records
+                        )
+                        if on_progress:
+                            on_progress(
+                                page_offset,
+                                page_index,
+                                total_pages,
+                                effective_page_size,
+                            )
+                    if len(page_records) < effective_page_size:
+                        # A short or empty page ends the listing.
+                        for _, pending in window:
+                            pending.cancel()
+                        break
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        window.append(
+                            (
+                                next_offset,
+                                executor.submit(
+                                    fetch_page, next_offset, effective_page_size
+                                ),
+                            )
+                        )
+            break
         offset = meta.next_offset
         time.sleep(wait_val)
     pbar.close()
@@ -412,48 +524,98 @@ def gather_single_page_metadata(fetch_page: Callable[[], dict], data_key: str) -
     return response.get(str(data_key), [])
 
 
-def gather_data(
+def iter_data(
     endpoint_func: Callable[..., tuple[list, int, int]],
     *args,
+    prefetch: bool = False,
     **kwargs,
-) -> list:
-    """Aggregate results from endpoints that return ``(results, next_offset, count)``.
+) -> Iterator:
+    """Yield results from endpoints that return ``(results, next_offset, count)``.
 
     Repeatedly calls ``endpoint_func`` with an advancing ``offset`` until
-    ``next_offset`` equals -1. Displays a progress bar when the total count
-    becomes known.
+    ``next_offset`` equals -1, yielding each page's items as soon as it
+    arrives so callers can process page N while page N+1 is fetched.
+    Displays a progress bar when the total count becomes known.
 
     Args:
         endpoint_func: Callable returning ``(results, next_offset, count)``.
         *args, **kwargs: Forwarded to ``endpoint_func`` (``offset`` may be
             provided via kwargs to start from a non-zero offset).
+        prefetch: When True, the next page is requested on a background
+            thread as soon as its offset is known, overlapping that request
+            with the caller's processing of the current page.
 
-    Returns:
-        A list containing all aggregated result items.
+    Yields:
+        Individual result items in page order.
     """
-    start = time.time()
-    all_results = []
     offset = kwargs.pop("offset", 0)
     total_count = None
     pbar = None
-    while offset != -1:
-        results, next_offset, count = endpoint_func(*args, offset=offset, **kwargs)
-        all_results.extend(results)
-        if total_count is None:
-            total_count = count
-            if total_count:
-                pbar = tqdm(total=total_count)
+
+    def fetch(page_offset: int) -> tuple[list, int, int]:
+        API_RATE_LIMITER.acquire()
+        return endpoint_func(*args, offset=page_offset, **kwargs)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        pending = executor.submit(fetch, offset) if executor else None
+        while offset != -1:
+            if pending is not None:
+                results, next_offset, count = pending.result()
+                # Keep exactly one request in flight while this page is consumed.
+                pending = (
+                    executor.submit(fetch, next_offset) if next_offset != -1 else None
+                )
+            else:
+                results, next_offset, count = fetch(offset)
+            if total_count is None:
+                total_count = count
+                if total_count:
+                    pbar = tqdm(total=total_count)
+            if pbar:
+                pbar.update(len(results))
+            yield from results
+            offset = next_offset
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
         if pbar:
-            pbar.update(len(results))
-        determine_pagination_wait(start, offset)
-        offset = next_offset
-    if pbar:
-        pbar.close()
-    return all_results
+            pbar.close()
+
+
+def gather_data(
+    endpoint_func: Callable[..., tuple[list, int, int]],
+    *args,
+    **kwargs,
+) -> list:
+    """Aggregate results from endpoints that return ``(results, next_offset, count)``.
+
+    Thin wrapper over :func:`iter_data` for callers that need the full list.
+
+    Returns:
+        A list containing all aggregated result items.
+    """
+    return list(iter_data(endpoint_func, *args, **kwargs))
+
+
+def _pdf_filename(url: str) -> str:
+    """Return the on-disk name for the PDF at ``url``."""
+    try:
+        # Use the canonical URL->id parser and sanitize for filesystem use
+        return parse_url_to_id(url).replace(":", "_")
+    except Exception:
+        # fallback to path basename when parsing fails
+        return os.path.basename(urlparse(url).path) or url
 
 
 def download_pdf(lnk: HttpUrl) -> str:
-    """Download a PDF from a link using Selenium and return the filename.
+    """Download a PDF from a link and return the filename.
+
+    The PDF is streamed over a pooled HTTP session straight to disk. Only
+    when the server answers with an HTML page (e.g. a JavaScript redirect)
+    or still refuses the request after one retry with browser-like headers
+    (:data:`PDF_HEADERS`) is a headless browser used to complete the
+    download.
 
     Args:
         lnk: URL pointing to the PDF to download.
@@ -461,8 +623,52 @@ def download_pdf(lnk: HttpUrl) -> str:
     Returns:
         The basename of the downloaded file saved into a temporary folder.
     """
-    options = Options()
+    # Imported here: the client module imports this one.
+    from src.data_collection.client import get_shared_session
+
     download_folder = os.path.join(os.getcwd(), "tmp")
+    os.makedirs(download_folder, exist_ok=True)
+    url = str(lnk)
+    filename = _pdf_filename(url)
+    session = get_shared_session()
+    resp = session.get(url, stream=True, timeout=30)
+    if resp.status_code == 403:
+        # The site turns away scripted clients; browser-like headers plus any
+        # cookies the first response set on the session usually get through.
+        resp.close()
+        resp = session.get(url, stream=True, timeout=30, headers=PDF_HEADERS)
+    with resp:
+        if resp.status_code == 403:
+            return _download_pdf_with_browser(url, download_folder, filename)
+        resp.raise_for_status()
+        content_type = resp.headers.get("content-type", "").lower()
+        if content_type.startswith("text/html"):
+            return _download_pdf_with_browser(url, download_folder, filename)
+        resp.raw.decode_content = True
+        path = os.path.join(download_folder, filename)
+        # Stream under a temporary name so an interrupted transfer never
+        # leaves a truncated file that looks like a finished download.
+        partial = f"{path}.part"
+        try:
+            with open(partial, "wb") as f:
+                shutil.copyfileobj(resp.raw, f, length=1 << 20)
+            os.replace(partial, path)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+    logger.info("Downloaded PDF: %s", filename)
+    return filename
+
+
+def _download_pdf_with_browser(url: str, download_folder: str, filename: str) -> str:
+    """Fallback for `download_pdf` when the link serves HTML instead of a PDF."""
+    # Selenium is only needed here; importing it lazily keeps it off the
+    # import path of the client and every model module.
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.webdriver import WebDriver as Chrome
+
+    options = Options()
     profile = {
         "plugins.plugins_list": [{"enabled": False, "name": "Chrome PDF Viewer"}],
         "download.default_directory": download_folder,
@@ -478,17 +684,89 @@ def download_pdf(lnk: HttpUrl) -> str:
     options.add_argument("--disable-features=VizDisplayCompositor")
     options.add_experimental_option("prefs", profile)
     driver = Chrome(options=options)
-    driver.get(str(lnk))
-
-    try:
-        # Use the canonical URL->id parser and sanitize for filesystem use
-        filename = parse_url_to_id(str(lnk)).replace(":", "_")
-    except Exception:
-        # fallback to path basename when parsing fails
-        from urllib.parse import urlparse
-
-        filename = os.path.basename(urlparse(str(lnk)).path) or str(lnk)
-    logger.info("Downloaded PDF: %s", filename)
+    driver.get(url)
+    logger.info("Downloaded PDF via browser: %s", filename)
     time.sleep(3)
     driver.close()
     return filename
+
+
+async def download_pdfs(
+    urls: list[str],
+    folder: Optional[str] = None,
+    concurrency: int = 16,
+    max_retries: int = 3,
+    base_delay: float = 0.5,
+    timeout: float = 60.0,
+) -> list[str | BaseException]:
+    """Download many PDFs concurrently and return their filenames.
+
+    Files are streamed in 1 MiB chunks under a shared connection pool, with
+    at most ``concurrency`` downloads in flight. Disk writes run in worker
+    threads so they do not block the event loop. Each download is retried
+    with exponential backoff; a download that still fails contributes its
+    exception to the result instead of aborting the batch, and leaves no
+    partial file behind.
+
+    Args:
+        urls: PDF links to download.
+        folder: Destination directory (defaults to ``./tmp``).
+        concurrency: Maximum simultaneous downloads.
+        max_retries: Retries per download after the first attempt.
+        base_delay: Initial backoff delay in seconds.
+        timeout: Seconds allowed to connect and between received chunks.
+
+    Returns:
+        One entry per URL, in order: the saved basename or the final error.
+    """
+    import asyncio
+
+    import aiohttp
+
+    download_folder = folder or os.path.join(os.getcwd(), "tmp")
+    os.makedirs(download_folder, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def save(resp: aiohttp.ClientResponse, path: str) -> None:
+        f = await asyncio.to_thread(open, path, "wb")
+        try:
+            async for chunk in resp.content.iter_chunked(1 << 20):
+                await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            f.close()
+            os.remove(path)
+            raise
+        await asyncio.to_thread(f.close)
+
+    async def fetch(session: aiohttp.ClientSession, url: str) -> str:
+        filename = _pdf_filename(url)
+        path = os.path.join(download_folder, filename)
+        attempt = 0
+        while True:
+            try:
+                async with semaphore, session.get(url) as resp:
+                    resp.raise_for_status()
+                    await save(resp, path)
+                logger.info("Downloaded PDF: %s", filename)
+                return filename
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                permanent = (
+                    isinstance(exc, aiohttp.ClientResponseError)
+                    and exc.status < 500
+                    and exc.status != 429
+                )
+                if permanent or attempt >= max_retries:
+                    raise
+                delay = base_delay * (2**attempt)
+                attempt += 1
+                logger.warning("PDF download failed (%s); retrying in %.1fs", exc, delay)
+                await asyncio.sleep(delay)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=client_timeout
+    ) as session:
+        return await asyncio.gather(
+            *(fetch(session, str(url)) for url in urls), return_exceptions=True
+        )
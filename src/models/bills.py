@@ -3,12 +3,14 @@
 Each model includes per-field descriptions that explain what each attribute answers.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import StrEnum
-from typing import Annotated, List, Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Callable, Iterable, List, Optional, Union
 
-from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 import logging
 
 from src.data_collection.client import CDGClient
@@ -16,17 +18,60 @@ from src.data_collection.id_utils import parse_url_to_id
 from src.models.people import Chamber, Member, Sponsor, SponsorRef
 from src.models.shared import (
     Activity,
+    ApiUrl,
     CountUrl,
     EntityBase,
     Format,
     Note,
     SourceSystem,
     Title,
+    validate_many,
 )
-from src.models.validators import convert_law_type, normalize_chamber
+from src.models.validators import normalize_chamber
+
+if TYPE_CHECKING:
+    from src.data_collection.async_client import AsyncCDGClient
 
 logger = logging.getLogger(__name__)
 
+# lxml's C parser is much faster than the pure-Python "html.parser" on
+# large bill texts; fall back to the stdlib parser when it is unavailable.
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - depends on installed extras
+    HTML_PARSER = "html.parser"
+
+
+def _html_to_text(html: str) -> str:
+    """Return the visible text of an HTML document."""
+    # Imported here so loading the models does not pay for bs4/soupsieve.
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, HTML_PARSER).get_text()
+
+
+# Sub-resource endpoints fetched by the detail helpers, keyed by the
+# response field that holds each payload.
+BILL_DETAIL_ENDPOINTS = {
+    "actions": "actions",
+    "amendments": "amendments",
+    "committees": "committees",
+    "cosponsors": "cosponsors",
+    "relatedBills": "relatedbills",
+    "subjects": "subjects",
+    "summaries": "summaries",
+    "textVersions": "text",
+    "titles": "titles",
+}
+AMENDMENT_DETAIL_ENDPOINTS = {
+    "actions": "actions",
+    "cosponsors": "cosponsors",
+    "textVersions": "text",
+    "amendments": "amendments",
+}
+
 # The API returns CountUrl envelopes for these fields (never expanded lists).
 # Keep the typing succinct: these fields are `CountUrl` when present.
 
@@ -36,7 +81,7 @@ class Hearing(BaseModel):
 
     title: Annotated[str, Field(description="What the hearing title is.")]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(default=None, description="Where to retrieve the hearing in the API."),
     ] = None
     chamber: Annotated[
@@ -222,10 +267,10 @@ class BehalfType(StrEnum):
     SUBMITTED = "Submitted"
     PROPOSED = "Proposed"
 
-    @property
-    def type_url(self):
-        """Return the URL-friendly token for the behalf type."""
-        return self.value.split()[0]
+    def __init__(self, value: str):
+        """Initialize the enum and cache the URL-friendly token."""
+        self._value_ = value
+        self.type_url = value.split()[0]
 
 
 class AmendmentType(StrEnum):
@@ -250,6 +295,35 @@ class TextVersion(BaseModel):
     ]
     type: Annotated[str, Field(description="What type of text version this is.")]
 
+    @cached_property
+    def format_urls(self) -> dict[str, str]:
+        """Map each format type to its URL (first one wins), built once."""
+        urls: dict[str, str] = {}
+        for fmt in self.formats or []:
+            urls.setdefault(fmt.type, str(fmt.url))
+        return urls
+
+
+def _latest_format_url(
+    text_versions: Iterable[TextVersion], matches: Callable[[str], bool]
+) -> Optional[str]:
+    """Return the first matching format URL of the most recent text version.
+
+    Versions without a matching format are skipped; ties on ``date`` keep
+    the earlier entry in API order.
+    """
+    latest: Optional[tuple[datetime, str]] = None
+    for tv in text_versions:
+        url = next((u for t, u in tv.format_urls.items() if matches(t)), None)
+        if url is not None and (latest is None or tv.date > latest[0]):
+            latest = (tv.date, url)
+    return latest[1] if latest else None
+
+
+def _unwrap_details(keys: Iterable[str], responses: Iterable[dict]) -> dict:
+    """Map each detail key to its payload in the matching response envelope."""
+    return {key: data[key] for key, data in zip(keys, responses)}
+
 
 class BillTextResponse(BaseModel):
     """Response wrapper for bill text endpoints (list of text versions)."""
@@ -262,8 +336,9 @@ class BillTextResponse(BaseModel):
         Optional[dict], Field(default=None, description="Original request metadata")
     ] = None
     textVersions: Annotated[
-        List[TextVersion], Field(description="List of available text versions")
-    ] = []
+        List[TextVersion],
+        Field(default_factory=list, description="List of available text versions"),
+    ]
 
 
 class PolicyArea(BaseModel):
@@ -391,26 +466,12 @@ class LawMetadata(BaseModel):
     """Law metadata attached to a bill (law number and type)."""
 
     number: Annotated[str, Field(description="What the law number is.")]
+    # LawType values are the API strings, so pydantic's native enum
+    # validation coerces "Public Law"/"Private Law" without a validator.
     law_type: Annotated[
         LawType, Field(alias="type", description="What type of law this is.")
     ]
 
-    @field_validator("law_type", mode="before")
-    def convert_law_type(cls, value: str):
-        """Field validator to coerce incoming law type strings.
-
-        Accepts values like 'Public Law' or 'Private Law' and returns the
-        corresponding ``LawType`` enum via the shared ``convert_law_type``
-        helper. This runs in ``before`` mode to allow string inputs.
-
-        Args:
-            value: Incoming raw value for the ``law_type`` field.
-
-        Returns:
-            Converted enum value accepted by the field.
-        """
-        return convert_law_type(value)
-
 
 # General Committee model (API entity)
 class Committee(BaseModel):
@@ -427,7 +488,7 @@ class Committee(BaseModel):
         str, Field(alias="systemCode", description="What the committee system code is.")
     ]
     url: Annotated[
-        HttpUrl, Field(description="Where to retrieve the committee in the API.")
+        ApiUrl, Field(description="Where to retrieve the committee in the API.")
     ]
     # Preserve historical activity list when present in API responses
     history: Annotated[
@@ -435,7 +496,7 @@ class Committee(BaseModel):
         Field(
             default_factory=list, description="Historical snapshots of the committee"
         ),
-    ] = []
+    ]
     # Present in some API responses
     is_current: Annotated[
         Optional[bool],
@@ -455,12 +516,18 @@ class Committee(BaseModel):
     ] = None
     activities: Annotated[
         List[Activity],
-        Field(description="Which activities are recorded for the committee."),
-    ] = []
+        Field(
+            default_factory=list,
+            description="Which activities are recorded for the committee.",
+        ),
+    ]
     subcommittees: Annotated[
         List["Committee"],
-        Field(description="Which subcommittees belong to the committee."),
-    ] = []
+        Field(
+            default_factory=list,
+            description="Which subcommittees belong to the committee.",
+        ),
+    ]
 
     # Preserve additional API-provided fields that are not always present.
     # Some endpoints return these as either a list of items or a count/url wrapper
@@ -473,7 +540,7 @@ class Committee(BaseModel):
         ),
     ] = None
     committee_website_url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             alias="committeeWebsiteUrl",
             default=None,
@@ -622,7 +689,7 @@ class CommitteeMetadata(BaseModel):
     ]
     type: Annotated[str, Field(description="What type of committee this is.")]
     url: Annotated[
-        HttpUrl, Field(description="Where to retrieve the committee in the API.")
+        ApiUrl, Field(description="Where to retrieve the committee in the API.")
     ]
 
 
@@ -632,7 +699,7 @@ class RecordedVote(BaseModel):
     roll_number: Annotated[
         int, Field(alias="rollNumber", description="What the roll call number is.")
     ]
-    url: Annotated[HttpUrl, Field(description="Where to retrieve the vote in the API.")]
+    url: Annotated[ApiUrl, Field(description="Where to retrieve the vote in the API.")]
     chamber: Annotated[
         Chamber, Field(alias="chamber", description="Which chamber held the vote.")
     ]
@@ -662,8 +729,11 @@ class Action(BaseModel):
     type: Annotated[str | None, Field(description="What type of action this is.")] = ""
     committees: Annotated[
         Optional[List[CommitteeMetadata]],
-        Field(description="Which committees are associated with the action."),
-    ] = []
+        Field(
+            default_factory=list,
+            description="Which committees are associated with the action.",
+        ),
+    ]
     action_time: Annotated[
         Optional[datetime],
         Field(alias="actionTime", description="What time the action occurred."),
@@ -671,10 +741,11 @@ class Action(BaseModel):
     recorded_votes: Annotated[
         List[RecordedVote],
         Field(
+            default_factory=list,
             alias="recordedVotes",
             description="Which recorded votes are tied to the action.",
         ),
-    ] = []
+    ]
 
 
 class AmendmentMetadata(BaseModel):
@@ -695,7 +766,7 @@ class AmendmentMetadata(BaseModel):
         Field(alias="updateDate", description="When the amendment was last updated."),
     ]
     url: Annotated[
-        HttpUrl, Field(description="Where to retrieve the amendment in the API.")
+        ApiUrl, Field(description="Where to retrieve the amendment in the API.")
     ]
 
 
@@ -707,7 +778,7 @@ class Treaty(BaseModel):
         str, Field(alias="treatyNumber", description="What the treaty number is.")
     ]
     url: Annotated[
-        HttpUrl, Field(description="Where to retrieve the treaty in the API.")
+        ApiUrl, Field(description="Where to retrieve the treaty in the API.")
     ]
 
 
@@ -717,9 +788,11 @@ class Subjects(BaseModel):
     legislative_subjects: Annotated[
         List[LegislativeSubject],
         Field(
-            alias="legislativeSubjects", description="Which legislative subjects apply."
+            default_factory=list,
+            alias="legislativeSubjects",
+            description="Which legislative subjects apply.",
         ),
-    ] = []
+    ]
     policy_area: Annotated[
         PolicyArea, Field(alias="policyArea", description="What the policy area is.")
     ]
@@ -737,13 +810,14 @@ class BillMetadata(EntityBase):
     relationship_details: Annotated[
         List[RelationshipDetail],
         Field(
+            default_factory=list,
             alias="relationshipDetails",
             description="What relationship details are recorded.",
         ),
-    ] = []
+    ]
     title: Annotated[str, Field(description="What the bill title is.")]
     type: Annotated[str, Field(description="What type of bill this is.")]
-    url: Annotated[HttpUrl, Field(description="Where to retrieve the bill in the API.")]
+    url: Annotated[ApiUrl, Field(description="Where to retrieve the bill in the API.")]
 
     origin_chamber: Annotated[
         Optional[str],
@@ -840,13 +914,16 @@ class Amendment(BaseModel):
         Field(alias="updateDate", description="When the amendment was last updated."),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the amendment in the API."),
     ] = None
     sponsors: Annotated[
         List[Union[Member, SponsorRef]],
-        Field(description="Which members or refs sponsored the amendment."),
-    ] = []
+        Field(
+            default_factory=list,
+            description="Which members or refs sponsored the amendment.",
+        ),
+    ]
     on_behalf_of_sponsor: Annotated[
         Optional[Member],
         Field(
@@ -909,75 +986,100 @@ class Amendment(BaseModel):
     )
 
     def add_full_text(self, client: CDGClient) -> str:
-        """Fetch and return the full amendment text from formatted text versions."""
+        """Fetch and return the full amendment text from the latest formatted text version."""
         import requests
 
         if not self.text_versions or not isinstance(self.text_versions, list):
             return ""
 
-        for text_version in self.text_versions:
-            formats = getattr(text_version, "formats", []) or []
-            for fmt in formats:
-                ftype = getattr(fmt, "type", "")
-                if "Formatted" in ftype:
-                    try:
-                        resp = client.session.get(str(getattr(fmt, "url", "")))
-                        html = resp.text
-                        soup = BeautifulSoup(html, "html.parser")
-                        full_text = soup.get_text()
-                    except requests.RequestException as e:
-                        raise RuntimeError(
-                            f"Network error retrieving full text for text version {self.type}: {e}"
-                        ) from e
-                    except (AttributeError, TypeError) as e:
-                        raise RuntimeError(
-                            f"Parsing error for full text in text version {self.type}: {e}"
-                        ) from e
-                    return full_text
-        return ""
-
-    def get_amendment_details(self, client: CDGClient):
+        url = _latest_format_url(self.text_versions, lambda ftype: "Formatted" in ftype)
+        if url is None:
+            return ""
+        try:
+            return client.fetch_text(url, parse=_html_to_text)
+        except requests.RequestException as e:
+            raise RuntimeError(
+                f"Network error retrieving full text for text version {self.type}: {e}"
+            ) from e
+        except (AttributeError, TypeError) as e:
+            raise RuntimeError(
+                f"Parsing error for full text in text version {self.type}: {e}"
+            ) from e
+
+    def load_full_text(self, client: CDGClient) -> str:
+        """Return ``full_text``, fetching it on first use.
+
+        The detail loaders skip the text download unless asked, so callers
+        that never read the text avoid a request and an HTML parse.
+        """
+        if not self.full_text:
+            self.full_text = self.add_full_text(client)
+        return self.full_text
+
+    def _detail_requests(self) -> dict[str, str]:
+        """Return ``{response key: endpoint}`` for the amendment sub-resources."""
+        prefix = f"amendment/{self.congress}/{self.type.lower()}/{self.number}/"
+        return {
+            key: prefix + endpoint
+            for key, endpoint in AMENDMENT_DETAIL_ENDPOINTS.items()
+        }
+
+    def _apply_details(self, amendment_data: dict) -> None:
+        """Set related fields from the fetched sub-resource payloads."""
+        self.actions = validate_many(
+            Action, (x for x in amendment_data["actions"] if isinstance(x, dict))
+        )
+        self.cosponsors = validate_many(
+            Member, (x for x in amendment_data["cosponsors"] if isinstance(x, dict))
+        )
+        self.text_versions = validate_many(
+            TextVersion,
+            (x for x in amendment_data["textVersions"] if isinstance(x, dict)),
+        )
+
+    def get_amendment_details(
+        self, client: CDGClient, with_full_text: bool = False
+    ):
         """Populate the amendment with related actions, cosponsors, and text versions."""
         """
         Retrieve additional data for an amendment.
 
         Args:
             client (CDGClient): The client object.
-            amendment_metadata (AmendmentMetadata): The amendment metadata.
+            with_full_text: Also download the latest formatted text into
+                ``full_text``. Otherwise use `load_full_text` when needed.
 
         Returns:
             Amendment: The amendment object.
         """
-        amendment_data = {}
-        congress = self.congress
-        amendment_type = self.type
-        amendment_number = self.number
-        additional_amendment_data = {
-            "actions": "actions",
-            "cosponsors": "cosponsors",
-            "textVersions": "text",
-            "amendments": "amendments",
-        }
-
-        for key, endpoint in additional_amendment_data.items():
-            data = client.get_json(
-                f"amendment/{congress}/{amendment_type.lower()}/{amendment_number}/{endpoint}",
-                params={"format": None},
+        requests_by_key = self._detail_requests()
+        # Independent reads: fetch concurrently, as Bill.add_bill_details does.
+        with ThreadPoolExecutor(max_workers=len(requests_by_key)) as executor:
+            responses = executor.map(
+                lambda endpoint: client.get_json(endpoint, params={"format": None}),
+                requests_by_key.values(),
             )
-            amendment_data[key] = data[key]
-
-        self.actions = [
-            Action(**x) for x in amendment_data["actions"] if isinstance(x, dict)
-        ]
-        self.cosponsors = [
-            Member(**x) for x in amendment_data["cosponsors"] if isinstance(x, dict)
-        ]
-        self.text_versions = [
-            TextVersion(**x)
-            for x in amendment_data["textVersions"]
-            if isinstance(x, dict)
-        ]
-        self.full_text = self.add_full_text(client)
+            self._apply_details(_unwrap_details(requests_by_key, responses))
+        if with_full_text:
+            self.load_full_text(client)
+
+    async def aget_amendment_details(
+        self, client: "AsyncCDGClient", with_full_text: bool = False
+    ):
+        """Async counterpart of `get_amendment_details`.
+
+        The sub-resource requests are issued concurrently through
+        `AsyncCDGClient.aget_many`, so the amendment costs about one round
+        trip instead of one per sub-resource.
+        """
+        requests_by_key = self._detail_requests()
+        responses = await client.aget_many(
+            list(requests_by_key.values()), params={"format": None}
+        )
+        self._apply_details(_unwrap_details(requests_by_key, responses))
+        if with_full_text:
+            # Full-text retrieval uses the blocking session; keep it off the loop.
+            await asyncio.to_thread(self.load_full_text, client)
 
     def build_id(self) -> str:
         """Return a canonical id for this amendment instance."""
@@ -1069,8 +1171,12 @@ class Bill(EntityBase):
     ]
     laws: Annotated[
         List[LawMetadata],
-        Field(alias="laws", description="Which laws are associated with the bill."),
-    ] = []
+        Field(
+            default_factory=list,
+            alias="laws",
+            description="Which laws are associated with the bill.",
+        ),
+    ]
     number: Annotated[str, Field(description="What the bill number is.")]
     origin_chamber: Annotated[
         Chamber,
@@ -1112,7 +1218,7 @@ class Bill(EntityBase):
     ] = None
 
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             default=None,
             alias="legislationUrl",
@@ -1134,114 +1240,171 @@ class Bill(EntityBase):
         return values
 
     def add_full_text(self, client: CDGClient) -> str:
-        """Fetch and return the full bill text from formatted text versions."""
+        """Fetch and return the full bill text from the latest formatted text version."""
         import requests
 
         if not self.text_versions or not isinstance(self.text_versions, list):
             return ""
 
-        for text_version in self.text_versions:
-            formats = getattr(text_version, "formats", []) or []
-            for fmt in formats:
-                ftype = getattr(fmt, "type", "")
-                if ftype == "Formatted Text":
-                    try:
-                        resp = client.session.get(str(getattr(fmt, "url", "")))
-                        html = resp.text
-                        soup = BeautifulSoup(html, "html.parser")
-                        full_text = soup.get_text()
-                    except requests.RequestException as e:
-                        raise RuntimeError(
-                            f"Network error retrieving full text for text version {self.type}: {e}"
-                        ) from e
-                    except (AttributeError, TypeError) as e:
-                        raise RuntimeError(
-                            f"Parsing error for full text in text version {self.type}: {e}"
-                        ) from e
-                    return full_text
-        return ""
-
-    def add_bill_details(self, client: CDGClient):
+        url = _latest_format_url(self.text_versions, lambda ftype: ftype == "Formatted Text")
+        if url is None:
+            return ""
+        try:
+            return client.fetch_text(url, parse=_html_to_text)
+        except requests.RequestException as e:
+            raise RuntimeError(
+                f"Network error retrieving full text for text version {self.type}: {e}"
+            ) from e
+        except (AttributeError, TypeError) as e:
+            raise RuntimeError(
+                f"Parsing error for full text in text version {self.type}: {e}"
+            ) from e
+
+    def load_full_text(self, client: CDGClient) -> str:
+        """Return ``full_text``, fetching it on first use.
+
+        The detail loaders skip the text download unless asked, so callers
+        that never read the text avoid a request and an HTML parse.
+        """
+        if not self.full_text:
+            self.full_text = self.add_full_text(client)
+        return self.full_text
+
+    def _detail_requests(
+        self, include: Optional[Iterable[str]] = None
+    ) -> dict[str, str]:
+        """Return ``{response key: endpoint}`` for the bill sub-resources.
+
+        Args:
+            include: response keys to fetch (e.g. ``("actions", "cosponsors")``);
+                ``None`` selects every sub-resource.
+        """
+        endpoints = BILL_DETAIL_ENDPOINTS
+        if include is not None:
+            include = set(include)
+            unknown = include - endpoints.keys()
+            if unknown:
+                raise ValueError(f"Unknown bill sub-resources: {sorted(unknown)}")
+            endpoints = {k: v for k, v in endpoints.items() if k in include}
+        prefix = f"bill/{self.congress}/{self.type.lower()}/{self.number}/"
+        return {key: prefix + endpoint for key, endpoint in endpoints.items()}
+
+    def _apply_details(self, bill_data: dict) -> None:
+        """Set related fields from the fetched sub-resource payloads.
+
+        Only the sub-resources present in ``bill_data`` are applied.
+        """
+        if "actions" in bill_data:
+            actions = bill_data["actions"]
+            self.actions = (
+                validate_many(Action, actions) if isinstance(actions, list) else []
+            )
+        if "amendments" in bill_data:
+            amendments = bill_data["amendments"]
+            self.amendments = (
+                validate_many(Amendment, amendments) if isinstance(amendments, list) else []
+            )
+        if "cosponsors" in bill_data:
+            cosponsors = bill_data["cosponsors"]
+            self.cosponsors = (
+                validate_many(Sponsor, cosponsors) if isinstance(cosponsors, list) else []
+            )
+        if "relatedBills" in bill_data:
+            # relatedBills may be either a list of BillMetadata dicts or a CountUrl-style dict
+            rb = bill_data.get("relatedBills")
+            if isinstance(rb, dict) and rb.get("count") is not None and rb.get("url"):
+                self.related_bills = CountUrl(**rb)
+            elif isinstance(rb, list):
+                self.related_bills = validate_many(BillMetadata, rb)
+            else:
+                self.related_bills = None
+        if "subjects" in bill_data:
+            subjects_data = bill_data["subjects"]
+            legislative_subjects = validate_many(
+                LegislativeSubject, subjects_data.get("legislativeSubjects", [])
+            )
+            policy_area = (
+                PolicyArea(**subjects_data["policyArea"])
+                if "policyArea" in subjects_data
+                else PolicyArea(name="")
+            )
+            self.subjects = Subjects(
+                legislative_subjects=legislative_subjects, policy_area=policy_area
+            )
+        if "summaries" in bill_data:
+            summaries = bill_data["summaries"]
+            self.summaries = (
+                validate_many(Summary, summaries) if isinstance(summaries, list) else []
+            )
+        if "textVersions" in bill_data:
+            # textVersions may be a list of TextVersion dicts or a CountUrl dict
+            tv = bill_data.get("textVersions")
+            if isinstance(tv, dict) and tv.get("count") is not None and tv.get("url"):
+                self.text_versions = CountUrl(**tv)
+            elif isinstance(tv, list):
+                self.text_versions = validate_many(TextVersion, tv)
+            else:
+                self.text_versions = None
+        if "titles" in bill_data:
+            self.titles = validate_many(Title, bill_data["titles"])
+
+    def add_bill_details(
+        self,
+        client: CDGClient,
+        include: Optional[Iterable[str]] = None,
+        with_full_text: bool = False,
+    ):
         """Populate the bill with related actions, summaries, and linked entities."""
         """
         Retrieve additional data for a bill.
 
         Args:
             client: A CDGClient object.
+            include: sub-resources to fetch, by response key (``"actions"``,
+                ``"cosponsors"``, ``"textVersions"``, ...). Defaults to all of
+                them.
+            with_full_text: Also download the latest formatted text into
+                ``full_text`` (requires ``textVersions``). Otherwise use
+                `load_full_text` when the text is needed.
         """
-        bill_data = {}
-        # Currently available endpoints for additional data on bills
-        additional_bill_data = {
-            "actions": "actions",
-            "amendments": "amendments",
-            "committees": "committees",
-            "cosponsors": "cosponsors",
-            "relatedBills": "relatedbills",
-            "subjects": "subjects",
-            "summaries": "summaries",
-            "textVersions": "text",
-            "titles": "titles",
-        }
-        congress = self.congress
-        bill_type = self.type.lower()
-        bill_number = self.number
-        for key, endpoint in additional_bill_data.items():
-            data = client.get_json(
-                f"bill/{congress}/{bill_type}/{bill_number}/{endpoint}"
-            )
-            bill_data[key] = data[key]
-
-        self.actions = [
-            Action(**x)
-            for x in bill_data.get("actions", [])
-            if isinstance(bill_data.get("actions"), list)
-        ]
-        self.amendments = [
-            Amendment(**x)
-            for x in bill_data.get("amendments", [])
-            if isinstance(bill_data.get("amendments"), list)
-        ]
-        self.cosponsors = [
-            Sponsor(**x)
-            for x in bill_data.get("cosponsors", [])
-            if isinstance(bill_data.get("cosponsors"), list)
-        ]
-        # relatedBills may be either a list of BillMetadata dicts or a CountUrl-style dict
-        rb = bill_data.get("relatedBills")
-        if isinstance(rb, dict) and rb.get("count") is not None and rb.get("url"):
-            self.related_bills = CountUrl(**rb)
-        elif isinstance(rb, list):
-            self.related_bills = [BillMetadata(**x) for x in rb]
-        else:
-            self.related_bills = None
-        subjects_data = bill_data["subjects"]
-        legislative_subjects = [
-            LegislativeSubject(**x)
-            for x in subjects_data.get("legislativeSubjects", [])
-        ]
-        policy_area = (
-            PolicyArea(**subjects_data["policyArea"])
-            if "policyArea" in subjects_data
-            else PolicyArea(name="")
-        )
-        self.subjects = Subjects(
-            legislative_subjects=legislative_subjects, policy_area=policy_area
-        )
-        self.summaries = [
-            Summary(**x)
-            for x in bill_data.get("summaries", [])
-            if isinstance(bill_data.get("summaries"), list)
-        ]
-        # textVersions may be a list of TextVersion dicts or a CountUrl dict
-        tv = bill_data.get("textVersions")
-        if isinstance(tv, dict) and tv.get("count") is not None and tv.get("url"):
-            self.text_versions = CountUrl(**tv)
-        elif isinstance(tv, list):
-            self.text_versions = [TextVersion(**x) for x in tv]
-        else:
-            self.text_versions = None
-        self.titles = [Title(**x) for x in bill_data["titles"]]
-        self.full_text = self.add_full_text(client)
+        requests_by_key = self._detail_requests(include)
+        if not requests_by_key:
+            return
+        # The sub-resources are independent reads, so fetch them concurrently;
+        # the client's limiter keeps the combined request rate in bounds.
+        with ThreadPoolExecutor(max_workers=len(requests_by_key)) as executor:
+            responses = executor.map(client.get_json, requests_by_key.values())
+            bill_data = _unwrap_details(requests_by_key, responses)
+
+        self._apply_details(bill_data)
+        if with_full_text and "textVersions" in bill_data:
+            self.load_full_text(client)
+
+    def add_summaries(self, client: CDGClient):
+        """Fetch only the bill's summaries (one request instead of nine)."""
+        self.add_bill_details(client, include=("summaries",))
+
+    async def aadd_bill_details(
+        self,
+        client: "AsyncCDGClient",
+        include: Optional[Iterable[str]] = None,
+        with_full_text: bool = False,
+    ):
+        """Async counterpart of `add_bill_details`.
+
+        All selected sub-resources are requested concurrently with
+        `AsyncCDGClient.aget_many`, bounded by the client's semaphore and
+        rate limiter.
+        """
+        requests_by_key = self._detail_requests(include)
+        if not requests_by_key:
+            return
+        responses = await client.aget_many(list(requests_by_key.values()))
+        bill_data = _unwrap_details(requests_by_key, responses)
+        self._apply_details(bill_data)
+        if with_full_text and "textVersions" in bill_data:
+            # Full-text retrieval uses the blocking session; keep it off the loop.
+            await asyncio.to_thread(self.load_full_text, client)
 
     def build_id(self) -> str:
         """Return a canonical id for this bill instance."""
@@ -1279,6 +1442,35 @@ class Law(Bill):
     ] = True
 
 
+# Concurrent detail fetching for bills and amendments
+async def aadd_bills_details(
+    bills: List["Bill"], client: "AsyncCDGClient", concurrency: int = 16
+) -> list:
+    """Populate details for many bills concurrently.
+
+    Returns one entry per bill: None on success, or the exception raised
+    while fetching that bill's details.
+    """
+    return await client.arun_many(
+        lambda bill: bill.aadd_bill_details(client), bills, concurrency
+    )
+
+
+async def aget_amendments_details(
+    amendments: List[Amendment], client: "AsyncCDGClient", concurrency: int = 16
+) -> list:
+    """Populate details for many amendments concurrently.
+
+    Returns one entry per amendment: None on success, or the exception
+    raised while fetching that amendment's details.
+    """
+    return await client.arun_many(
+        lambda amendment: amendment.aget_amendment_details(client),
+        amendments,
+        concurrency,
+    )
+
+
 # Committee Report model
 class CommitteeReport(EntityBase):
     """Committee report metadata with citation and issuance details."""
@@ -1287,7 +1479,7 @@ class CommitteeReport(EntityBase):
         str, Field(description="What the committee report citation is.")
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             default=None,
             description="Where to retrieve the committee report in the API.",
@@ -1311,7 +1503,7 @@ class CommitteePrint(BaseModel):
 
     title: Annotated[str, Field(description="What the committee print title is.")]
     url: Annotated[
-        HttpUrl, Field(description="Where to retrieve the committee print in the API.")
+        ApiUrl, Field(description="Where to retrieve the committee print in the API.")
     ]
     chamber: Annotated[Chamber, Field(description="Which chamber issued the print.")]
     committee_name: Annotated[
@@ -1331,7 +1523,7 @@ class CommitteeMeeting(BaseModel):
 
     name: Annotated[str, Field(description="What the meeting name is.")]
     url: Annotated[
-        HttpUrl, Field(description="Where to retrieve the meeting in the API.")
+        ApiUrl, Field(description="Where to retrieve the meeting in the API.")
     ]
     chamber: Annotated[Chamber, Field(description="Which chamber held the meeting.")]
     committee_name: Annotated[
@@ -120,6 +120,9 @@ class EndpointSpec(BaseModel):
     # Internal map of param name -> ParamSpec (private attr so Pydantic
     # doesn't treat this as a model field but static checkers still see it)
     _param_map: Dict[str, "ParamSpec"] = PrivateAttr(default_factory=dict)
+    # Path param names (all / required only), precomputed for `render_path`
+    _path_names: tuple[str, ...] = PrivateAttr(default=())
+    _required_path_names: tuple[str, ...] = PrivateAttr(default=())
 
     @model_validator(mode="after")
     def _build_param_map(self):
@@ -130,6 +133,13 @@ class EndpointSpec(BaseModel):
         """
         specs = getattr(self, "param_specs", []) or []
         object.__setattr__(self, "_param_map", {p.name: p for p in specs})
+        path_specs = [p for p in specs if p.location == ParamLocation.PATH]
+        object.__setattr__(self, "_path_names", tuple(p.name for p in path_specs))
+        object.__setattr__(
+            self,
+            "_required_path_names",
+            tuple(p.name for p in path_specs if p.required),
+        )
         return self
 
     def render_path(self, base_url: str, params: Mapping[str, object]) -> str:
@@ -139,17 +149,12 @@ class EndpointSpec(BaseModel):
         """
         path = self.path_template
         # Validate required path params
-        for name, p in self._param_map.items():
-            if p.location == ParamLocation.PATH and p.required and name not in params:
+        for name in self._required_path_names:
+            if name not in params:
                 raise ValueError(f"Missing required path param: {name}")
         try:
             rendered = path.format(
-                **{
-                    k: v
-                    for k, v in params.items()
-                    if k in self._param_map
-                    and self._param_map[k].location == ParamLocation.PATH
-                }
+                **{k: params[k] for k in self._path_names if k in params}
             )
         except KeyError as e:
             raise ValueError(f"Missing path parameter for template: {e}")
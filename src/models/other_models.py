@@ -7,11 +7,11 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, model_validator
+from pydantic import BaseModel, Field, model_validator
 import logging
 
 logger = logging.getLogger(__name__)
-from src.models.shared import EntityBase, Format, CountUrl
+from src.models.shared import ApiUrl, CachedHttpUrl, EntityBase, Format, CountUrl
 
 
 class RecordTypeBase(BaseModel):
@@ -116,7 +116,7 @@ class HouseCommunication(EntityBase):
         Optional[datetime], Field(description="When the communication was submitted.")
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the communication record in the API."),
     ] = None
     subject: Annotated[
@@ -254,7 +254,7 @@ class HouseRequirement(EntityBase):
         Optional[datetime], Field(description="When the requirement was recorded.")
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the requirement record in the API."),
     ] = None
 
@@ -269,7 +269,7 @@ class SenateCommunication(EntityBase):
         Optional[datetime], Field(description="When the communication was submitted.")
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the communication record in the API."),
     ] = None
     subject: Annotated[
@@ -302,7 +302,7 @@ class NomineePosition(BaseModel):
         Optional[str], Field(default=None, alias="positionTitle")
     ] = None
     intro_text: Annotated[Optional[str], Field(default=None, alias="introText")] = None
-    url: Annotated[Optional[HttpUrl], Field(default=None)] = None
+    url: Annotated[Optional[ApiUrl], Field(default=None)] = None
 
 
 class Nomination(EntityBase):
@@ -368,7 +368,7 @@ class Nomination(EntityBase):
         Field(description="What the current status of the nomination is."),
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the nomination record in the API."),
     ] = None
     subjects: Annotated[
@@ -452,7 +452,7 @@ class CRSReport(EntityBase):
         ),
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the CRS report in the API."),
     ] = None
     status: Annotated[
@@ -606,7 +606,7 @@ class EntireIssueEntry(BaseModel):
         Optional[str], Field(default=None, alias="type", description="Format type")
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[CachedHttpUrl],
         Field(default=None, alias="url", description="Where to fetch this part"),
     ] = None
 
@@ -689,7 +689,7 @@ class MemberDepiction(BaseModel):
         Optional[str], Field(description="Who to credit for the member image.")
     ] = None
     image_url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             default=None,
             alias="imageUrl",
@@ -746,7 +746,7 @@ class HouseCommunicationListItem(EntityBase, RecordTypeBase):
         Optional[int], Field(description="Which Congress the communication belongs to.")
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the communication record in the API."),
     ] = None
     update_date: Annotated[
@@ -780,7 +780,7 @@ class SenateCommunicationListItem(EntityBase, RecordTypeBase):
         Optional[int], Field(description="Which Congress the communication belongs to.")
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the communication record in the API."),
     ] = None
     update_date: Annotated[
@@ -810,7 +810,7 @@ class HouseRequirementListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the requirement record in the API."),
     ] = None
 
@@ -908,7 +908,7 @@ class NominationListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the nomination record in the API."),
     ] = None
     organization: Annotated[
@@ -958,7 +958,8 @@ class CRSReportListItem(EntityBase, RecordTypeBase):
         None
     )
     url: Annotated[
-        Optional[HttpUrl], Field(description="Where to retrieve the report in the API.")
+        Optional[ApiUrl],
+        Field(description="Where to retrieve the report in the API."),
     ] = None
 
 
@@ -985,7 +986,7 @@ class BillSummaryBill(BaseModel):
     ]
     number: Annotated[int, Field(description="What the bill number is.")]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the bill record in the API."),
     ] = None
     title: Annotated[Optional[str], Field(description="What the bill title is.")] = None
@@ -1185,7 +1186,7 @@ class HouseRollCallVoteListItem(EntityBase, RecordTypeBase):
         ),
     ] = None
     source_data_url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             default=None,
             alias="sourceDataURL",
@@ -1195,7 +1196,7 @@ class HouseRollCallVoteListItem(EntityBase, RecordTypeBase):
     # Accept `legislationUrl` from the API as an alias for `url` while still
     # allowing `url` to be used when populating by name.
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             default=None,
             alias="legislationUrl",
@@ -1332,7 +1333,7 @@ class DailyCongressionalRecordIssue(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the issue record in the API."),
     ] = None
     full_issue: Annotated[
@@ -1440,7 +1441,7 @@ class BoundCongressionalRecordListItem(EntityBase, RecordTypeBase):
         ),
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the bound record in the API."),
     ] = None
     reference_id: Annotated[
@@ -1740,7 +1741,7 @@ class CommitteeListItem(EntityBase, RecordTypeBase):
     ] = "congress-committees"
 
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the committee in the API."),
     ] = None
     system_code: Annotated[
@@ -1794,7 +1795,8 @@ class CommitteeReportListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl], Field(description="Where to retrieve the report in the API.")
+        Optional[ApiUrl],
+        Field(description="Where to retrieve the report in the API."),
     ] = None
     update_date: Annotated[
         Optional[datetime],
@@ -1882,7 +1884,7 @@ class AmendmentListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the amendment in the API."),
     ] = None
 
@@ -1970,7 +1972,8 @@ class BillListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl], Field(description="Where to retrieve the bill in the API.")
+        Optional[ApiUrl],
+        Field(description="Where to retrieve the bill in the API."),
     ] = None
 
 
@@ -2034,7 +2037,8 @@ class LawListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl], Field(description="Where to retrieve the law in the API.")
+        Optional[ApiUrl],
+        Field(description="Where to retrieve the law in the API."),
     ] = None
 
 
@@ -2052,7 +2056,7 @@ class CommitteePrintListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the committee print in the API."),
     ] = None
     update_date: Annotated[
@@ -2089,7 +2093,7 @@ class CommitteeMeetingListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the meeting in the API."),
     ] = None
     update_date: Annotated[
@@ -2144,7 +2148,7 @@ class HearingListItem(EntityBase, RecordTypeBase):
         Optional[int], Field(description="Which part of a multipart hearing this is.")
     ] = None
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the hearing in the API."),
     ] = None
 
@@ -2202,7 +2206,8 @@ class TreatyListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl], Field(description="Where to retrieve the treaty in the API.")
+        Optional[ApiUrl],
+        Field(description="Where to retrieve the treaty in the API."),
     ] = None
 
 
@@ -2255,7 +2260,7 @@ class MemberListItem(EntityBase, RecordTypeBase):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(description="Where to retrieve the member record in the API."),
     ] = None
 
@@ -7,10 +7,10 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Annotated, List, Optional
 
-from pydantic import AliasChoices, BaseModel, Field, HttpUrl, model_validator
+from pydantic import AliasChoices, BaseModel, Field, model_validator
 import logging
 
-from src.models.shared import CountUrl, EntityBase
+from src.models.shared import ApiUrl, CountUrl, EntityBase
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +47,8 @@ class Congress(BaseModel):
         int, Field(description="Which Congress number this record is for.")
     ]
     url: Annotated[
-        HttpUrl, Field(description="Where to retrieve the Congress record in the API.")
+        ApiUrl,
+        Field(description="Where to retrieve the Congress record in the API."),
     ]
     update_date: Annotated[
         datetime,
@@ -78,7 +79,8 @@ class CongressMetadata(BaseModel):
         ),
     ]
     url: Annotated[
-        Optional[HttpUrl], Field(default=None, description="Link to the congress item")
+        Optional[ApiUrl],
+        Field(default=None, description="Link to the congress item"),
     ]
     name: Annotated[
         Optional[str], Field(default=None, description="Display name of the congress")
@@ -106,7 +108,7 @@ class Depiction(BaseModel):
         str, Field(description="Who to credit for the member image.")
     ]
     image_url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             alias="imageUrl",
             default=None,
@@ -187,7 +189,7 @@ class Member(EntityBase):
         str, Field(description="Which state or territory the member represents.")
     ]
     url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             default=None, description="Where to retrieve the member record in the API."
         ),
@@ -233,7 +235,7 @@ class Member(EntityBase):
         ),
     ] = None
     official_website_url: Annotated[
-        Optional[HttpUrl],
+        Optional[ApiUrl],
         Field(
             default=None,
             alias="officialWebsiteUrl",
@@ -526,4 +528,4 @@ class SponsorRef(BaseModel):
     last_name: Annotated[Optional[str], Field(default=None, alias="lastName")] = None
     full_name: Annotated[Optional[str], Field(default=None, alias="fullName")] = None
     state: Annotated[Optional[str], Field(default=None)] = None
-    url: Annotated[Optional[HttpUrl], Field(default=None)] = None
+    url: Annotated[Optional[ApiUrl], Field(default=None)] = None
@@ -2,17 +2,73 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
-from typing import Annotated, Optional
-
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Annotated, Iterable, Optional, TypeVar
+
+from pydantic import (
+    BaseModel,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Congress.gov API links, member images and websites: stored or passed back
+# to the client as strings, on list and detail models alike, so the same
+# link dumps identically everywhere. Validated by a cheap scheme check
+# instead of HttpUrl, which builds a parsed Url object per field.
+# Downloadable document links (``Format.url``, full-issue parts) use
+# CachedHttpUrl instead.
+ApiUrl = Annotated[str, Field(pattern=r"^https?://")]
+
+# API dumps repeat the same links (committees, members, formats) across
+# thousands of rows. Parsed HttpUrl values are immutable, so each distinct
+# string is validated once and the resulting object is shared afterwards.
+_URL_CACHE_SIZE = 65536
+_url_cache: dict[str, HttpUrl] = {}
+
+
+def _cached_http_url(value: object, handler: ValidatorFunctionWrapHandler) -> HttpUrl:
+    """Validate ``value`` as an HttpUrl, reusing earlier results for strings."""
+    if not isinstance(value, str):
+        return handler(value)
+    url = _url_cache.get(value)
+    if url is None:
+        url = handler(value)
+        if len(_url_cache) >= _URL_CACHE_SIZE:
+            _url_cache.clear()
+        _url_cache[value] = url
+    return url
+
+
+CachedHttpUrl = Annotated[HttpUrl, WrapValidator(_cached_http_url)]
+
+
+@functools.lru_cache(maxsize=None)
+def list_adapter(model_cls: type[BaseModel]) -> TypeAdapter:
+    """Return a cached ``TypeAdapter(list[model_cls])`` for batch validation."""
+    return TypeAdapter(list[model_cls])
+
+
+def validate_many(model_cls: type[M], items: Iterable[dict]) -> list[M]:
+    """Validate ``items`` into ``model_cls`` instances in a single call.
+
+    Equivalent to ``[model_cls(**x) for x in items]`` but crosses into
+    pydantic-core once per list instead of once per element.
+    """
+    return list_adapter(model_cls).validate_python(list(items))
 
 
 class Format(BaseModel):
     """Format metadata for a text version (e.g., PDF, HTML)."""
 
     type: str = Field(description="What format type the text version is.")
-    url: HttpUrl = Field(description="Where to retrieve the formatted content.")
+    url: CachedHttpUrl = Field(description="Where to retrieve the formatted content.")
 
 
 class Activity(BaseModel):
@@ -26,7 +82,7 @@ class CountUrl(BaseModel):
     """Count and URL pair used by list endpoints."""
 
     count: int = Field(description="How many items are available.")
-    url: HttpUrl = Field(description="Where to retrieve the related list in the API.")
+    url: ApiUrl = Field(description="Where to retrieve the related list in the API.")
     count_including_withdrawn_cosponsors: Annotated[
         Optional[int], Field(alias="countIncludingWithdrawnCosponsors", default=None)
     ] = None
@@ -69,6 +125,14 @@ class Note(BaseModel):
 
     text: str = Field(description="What the note text is.")
 
+    @field_validator("text", mode="before")
+    @classmethod
+    def _join_text(cls, v):
+        """Join list-shaped note text (one string per paragraph) into one string."""
+        if isinstance(v, list):
+            return "\n".join(str(part) for part in v)
+        return v
+
 
 class EntityBase(BaseModel):
     """Base class for item models that may provide common identifier fields.
@@ -3,23 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 
 
 # Enums imported lazily inside functions to avoid circular imports
-def convert_law_type(value: str):
-    """Convert raw law type strings into the LawType enum.
-
-    Import enums lazily to avoid circular imports with model modules.
-    """
-    from src.models.bills import LawType
-
-    if value == "Public Law":
-        return LawType.PUBLIC
-    if value == "Private Law":
-        return LawType.PRIVATE
-    raise ValueError("Invalid law type")
-
-
 def normalize_chamber(v):
     """Normalize various chamber string forms into `Chamber` enum or None.
 
@@ -31,7 +18,15 @@ def normalize_chamber(v):
 
     if isinstance(v, Chamber):
         return v
-    raw = str(v).strip().lower()
+    return _chamber_from_str(str(v))
+
+
+@lru_cache(maxsize=64)
+def _chamber_from_str(value: str):
+    """Map a raw chamber string to `Chamber`; cached since the API uses few spellings."""
+    from src.models.people import Chamber
+
+    raw = value.strip().lower()
     if "house" in raw or "represent" in raw or raw in ("h", "hr"):
         return Chamber.HOUSE
     if raw.startswith("sen") or "senate" in raw or raw in ("s",):
@@ -0,0 +1,104 @@
+"""Submit many chat prompts through the OpenAI Batch API.
+
+Non-interactive generation (e.g. backfilling bill summaries) does not need
+one HTTPS round trip per prompt. `submit_batch` uploads every request as a
+single JSONL file, lets OpenAI run them asynchronously, and returns the
+completions in prompt order. Use `get_client()` directly for interactive,
+single-prompt calls.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import orjson
+from openai import OpenAI
+
+from settings import OPENAI_MODEL
+from src.services.generative import get_client
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHAT_ENDPOINT = "/v1/chat/completions"
+_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing"})
+
+
+def _batch_lines(
+    prompts: list[str], model: str, system_prompt: Optional[str]
+) -> bytes:
+    """Encode ``prompts`` as Batch API request lines keyed by prompt index."""
+    prefix = [{"role": "system", "content": system_prompt}] if system_prompt else []
+    return b"\n".join(
+        orjson.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": CHAT_ENDPOINT,
+                "body": {
+                    "model": model,
+                    "messages": [*prefix, {"role": "user", "content": prompt}],
+                },
+            }
+        )
+        for i, prompt in enumerate(prompts)
+    )
+
+
+def submit_batch(
+    prompts: list[str],
+    model: str = OPENAI_MODEL,
+    system_prompt: Optional[str] = None,
+    poll_interval: float = 30.0,
+    client: Optional[OpenAI] = None,
+) -> list[Optional[str]]:
+    """Run ``prompts`` as one Batch API job and wait for the completions.
+
+    Args:
+        prompts: User prompts, one chat completion each.
+        model: Chat model to use.
+        system_prompt: Optional system message prepended to every prompt.
+        poll_interval: Seconds between batch status checks.
+        client: OpenAI client; defaults to the shared `get_client()`.
+
+    Returns:
+        One entry per prompt, in order: the completion text, or None when
+        that individual request failed.
+
+    Raises:
+        RuntimeError: if the batch does not complete (failed, expired or
+            cancelled).
+    """
+    if not prompts:
+        return []
+    client = client or get_client()
+    upload = client.files.create(
+        file=("batch.jsonl", _batch_lines(prompts, model, system_prompt)),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id, endpoint=CHAT_ENDPOINT, completion_window="24h"
+    )
+    logger.info("Submitted batch %s with %d prompts", batch.id, len(prompts))
+    while batch.status in _PENDING_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+    results: list[Optional[str]] = [None] * len(prompts)
+    if batch.output_file_id:
+        output = client.files.content(batch.output_file_id).content
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning("batch request %s failed: %s", row.get("custom_id"), row)
+                continue
+            results[int(row["custom_id"])] = response["body"]["choices"][0][
+                "message"
+            ]["content"]
+    return results
@@ -5,7 +5,9 @@ AI providers so callers may import a configured client from a single
 place. Keep this module small and focused on configuration.
 """
 
-from openai import OpenAI
+import functools
+
+from openai import AsyncOpenAI, OpenAI
 
 from settings import OPENAI_API_KEY, TIMEOUT_SECS
 from src.utils.logger import get_logger
@@ -13,14 +15,28 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_client() -> OpenAI:
-    """Create and return a configured OpenAI client.
+    """Return the shared, configured OpenAI client.
 
-    The client is constructed using project-level settings for API key
-    and timeout. Callers should not modify the client configuration.
+    The client is constructed once using project-level settings for API
+    key and timeout, so repeated calls reuse its HTTP connection pool.
+    Callers should not modify the client configuration.
 
     Returns:
         OpenAI: an initialized OpenAI client instance.
     """
-    client = OpenAI(api_key=OPENAI_API_KEY, timeout=TIMEOUT_SECS, max_retries=5)
-    return client
+    return OpenAI(api_key=OPENAI_API_KEY, timeout=TIMEOUT_SECS, max_retries=5)
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> AsyncOpenAI:
+    """Return the shared, configured async OpenAI client.
+
+    Async counterpart of :func:`get_client` for coroutine call sites.
+    Callers should not modify the client configuration.
+
+    Returns:
+        AsyncOpenAI: an initialized async OpenAI client instance.
+    """
+    return AsyncOpenAI(api_key=OPENAI_API_KEY, timeout=TIMEOUT_SECS, max_retries=5)
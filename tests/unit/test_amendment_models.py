@@ -20,7 +20,7 @@ def test_amendment_list_item_parse():
     assert inst.congress == 117
     assert inst.number == "A1"
     assert inst.type == "HAMDT"
-    assert inst.url.host == "api.congress.gov"
+    assert inst.url.startswith("https://api.congress.gov/")
 
 
 def test_amendment_model_parse():
@@ -0,0 +1,220 @@
+import asyncio
+
+import orjson
+from pydantic import BaseModel
+
+from src.data_collection.async_client import AsyncCDGClient
+from src.models.endpoint_spec import EndpointSpec, PaginationSpec
+
+
+class CongressItem(BaseModel):
+    name: str = ""
+
+
+def test_afetch_pages_fetches_remaining_pages_concurrently(monkeypatch):
+    c = AsyncCDGClient(api_key="")
+    names = [f"{n}th Congress" for n in range(118, 113, -1)]
+    requested = []
+
+    async def fake_request(url, params, timeout=10):
+        offset, limit = int(params["offset"]), int(params["limit"])
+        requested.append(offset)
+        # later pages answer first to prove results are reassembled in order
+        await asyncio.sleep(0.01 * (10 - offset))
+        pagination = {"count": len(names)}
+        if offset + limit < len(names):
+            pagination["next"] = (
+                f"https://api.congress.gov/v3/congress?offset={offset + limit}&limit={limit}"
+            )
+        return {
+            "congresses": [{"name": n} for n in names[offset : offset + limit]],
+            "pagination": pagination,
+        }
+
+    monkeypatch.setattr(c, "_arequest_json", fake_request)
+
+    spec = EndpointSpec(name="congress", path_template="/congress", param_specs=[])
+    spec.response_model = CongressItem
+    spec.data_key = "congresses"
+    spec.pagination = PaginationSpec(default_limit=2)
+
+    pages = asyncio.run(c.afetch_pages(spec))
+    assert sorted(requested) == [0, 2, 4]
+    assert [item.name for page, _, _ in pages for item in page] == names
+
+    records = asyncio.run(c.afetch_all(spec))
+    assert [item.name for item in records] == names
+
+
+def test_aget_many_preserves_endpoint_order(monkeypatch):
+    c = AsyncCDGClient(api_key="")
+
+    async def fake_request(url, params, timeout=10):
+        number = int(url.rsplit("/", 1)[-1])
+        await asyncio.sleep(0.01 * (5 - number))
+        return {"congress": {"number": number}}
+
+    monkeypatch.setattr(c, "_arequest_json", fake_request)
+
+    results = asyncio.run(c.aget_many([f"congress/{i}" for i in range(1, 5)]))
+    assert [r["congress"]["number"] for r in results] == [1, 2, 3, 4]
+
+
+def test_aget_amendment_details_fetches_sub_resources_concurrently(monkeypatch):
+    from datetime import datetime
+
+    from src.models.bills import Amendment
+
+    c = AsyncCDGClient(api_key="")
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_request(url, params, timeout=10):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        key = {"text": "textVersions"}.get(url.rsplit("/", 1)[-1], url.rsplit("/", 1)[-1])
+        return {key: []}
+
+    monkeypatch.setattr(c, "_arequest_json", fake_request)
+
+    amendment = Amendment(congress=118, number="1", type="HAMDT", updateDate=datetime.now())
+    asyncio.run(amendment.aget_amendment_details(c))
+    assert in_flight["peak"] == 4
+    assert amendment.actions == [] and amendment.text_versions == []
+
+
+def test_arun_many_bounds_concurrency_and_collects_errors():
+    c = AsyncCDGClient(api_key="")
+    in_flight = {"now": 0, "peak": 0}
+
+    async def work(n):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if n == 3:
+            raise ValueError("bad item")
+        return n * 2
+
+    results = asyncio.run(c.arun_many(work, range(6), concurrency=2))
+    assert in_flight["peak"] == 2
+    assert results[:3] == [0, 2, 4] and results[4:] == [8, 10]
+    assert isinstance(results[3], ValueError)
+
+
+def test_identical_in_flight_requests_are_coalesced(monkeypatch):
+    c = AsyncCDGClient(api_key="")
+    sent = []
+
+    async def fake_send(url, query, timeout=10):
+        sent.append(url)
+        await asyncio.sleep(0.01)
+        return orjson.dumps({"url": url})
+
+    monkeypatch.setattr(c, "_asend", fake_send)
+
+    async def run():
+        return await asyncio.gather(
+            c.aget_json("bill/118/hr/1/actions"),
+            c.aget_json("bill/118/hr/1/actions"),
+            c.aget_json("bill/118/hr/1/titles"),
+        )
+
+    results = asyncio.run(run())
+    assert len(sent) == 2
+    assert results[0] == results[1]
+    # Each waiter gets its own decoded object, so in-place edits don't leak.
+    assert results[0] is not results[1]
+    assert c._inflight == {}
+
+
+def test_afetch_pages_cancels_outstanding_pages_on_failure(monkeypatch):
+    import pytest
+
+    c = AsyncCDGClient(api_key="")
+    cancelled = []
+
+    async def fake_request(url, params, timeout=10):
+        offset = int(params["offset"])
+        if offset == 2:
+            raise ValueError("bad page")
+        if offset == 4:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(offset)
+                raise
+        return {
+            "congresses": [{"name": "118th Congress"}, {"name": "117th Congress"}],
+            "pagination": {
+                "count": 6,
+                "next": "https://api.congress.gov/v3/congress?offset=2&limit=2",
+            },
+        }
+
+    monkeypatch.setattr(c, "_arequest_json", fake_request)
+
+    spec = EndpointSpec(name="congress", path_template="/congress", param_specs=[])
+    spec.response_model = CongressItem
+    spec.data_key = "congresses"
+    spec.pagination = PaginationSpec(default_limit=2)
+
+    with pytest.raises(ValueError):
+        asyncio.run(c.afetch_pages(spec))
+    assert cancelled == [4]
+
+
+def test_afetch_pages_follows_a_capped_server_page_size(monkeypatch):
+    c = AsyncCDGClient(api_key="")
+    names = [f"{n}th Congress" for n in range(118, 111, -1)]
+    requested = []
+
+    async def fake_request(url, params, timeout=10):
+        # The server serves at most 2 records whatever limit is requested.
+        offset, limit = int(params["offset"]), min(int(params["limit"]), 2)
+        requested.append((offset, int(params["limit"])))
+        pagination = {"count": len(names)}
+        if offset + limit < len(names):
+            pagination["next"] = (
+                f"https://api.congress.gov/v3/congress?offset={offset + limit}&limit={limit}"
+            )
+        return {
+            "congresses": [{"name": n} for n in names[offset : offset + limit]],
+            "pagination": pagination,
+        }
+
+    monkeypatch.setattr(c, "_arequest_json", fake_request)
+
+    spec = EndpointSpec(name="congress", path_template="/congress", param_specs=[])
+    spec.response_model = CongressItem
+    spec.data_key = "congresses"
+    spec.pagination = PaginationSpec(default_limit=5)
+
+    records = asyncio.run(c.afetch_all(spec))
+    assert [item.name for item in records] == names
+    assert sorted(requested[1:]) == [(2, 2), (4, 2), (6, 2)]
+
+
+def test_cancelled_request_is_not_shared_with_new_callers(monkeypatch):
+    c = AsyncCDGClient(api_key="")
+    sent = []
+
+    async def fake_send(url, query, timeout=10):
+        sent.append(url)
+        await asyncio.sleep(0.05)
+        return orjson.dumps({"n": len(sent)})
+
+    monkeypatch.setattr(c, "_asend", fake_send)
+
+    async def run():
+        first = asyncio.ensure_future(c.aget_json("congress/118"))
+        await asyncio.sleep(0)
+        first.cancel()
+        # A caller arriving right after the cancellation gets its own request.
+        second = asyncio.ensure_future(c.aget_json("congress/118"))
+        await asyncio.sleep(0)
+        return await second
+
+    assert asyncio.run(run()) == {"n": 2}
+    assert c._inflight == {}
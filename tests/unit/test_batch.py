@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import orjson
+
+from src.services.batch import submit_batch
+
+
+class FakeBatchClient:
+    def __init__(self):
+        self.uploaded = b""
+        self.polls = 0
+
+        def files_create(file, purpose):
+            self.uploaded = file[1]
+            return SimpleNamespace(id="file-in")
+
+        def files_content(file_id):
+            requests = [orjson.loads(line) for line in self.uploaded.splitlines()]
+            rows = [
+                {
+                    "custom_id": r["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "choices": [{"message": {"content": prompt.upper()}}]
+                        },
+                    },
+                }
+                for r in reversed(requests[1:])
+                for prompt in [r["body"]["messages"][-1]["content"]]
+            ]
+            rows.append({"custom_id": "0", "response": {"status_code": 500}})
+            return SimpleNamespace(content=b"\n".join(orjson.dumps(r) for r in rows))
+
+        def batches_retrieve(batch_id):
+            self.polls += 1
+            return SimpleNamespace(
+                id=batch_id, status="completed", output_file_id="file-out"
+            )
+
+        self.files = SimpleNamespace(create=files_create, content=files_content)
+        self.batches = SimpleNamespace(
+            create=lambda **kw: SimpleNamespace(id="batch-1", status="validating"),
+            retrieve=batches_retrieve,
+        )
+
+
+def test_submit_batch_returns_completions_in_prompt_order():
+    client = FakeBatchClient()
+    results = submit_batch(["a", "b", "c"], model="m", poll_interval=0, client=client)
+
+    assert results == [None, "B", "C"]
+    assert client.polls == 1
+    first = orjson.loads(client.uploaded.splitlines()[0])
+    assert first["url"] == "/v1/chat/completions" and first["body"]["model"] == "m"
@@ -26,3 +26,10 @@ def test_bill_accepts_list_shaped_notes():
     assert isinstance(notes, list)
     assert len(notes) == 1
     assert getattr(notes[0], "text", None) == "For further action, see S.2739."
+
+
+def test_note_joins_list_shaped_text():
+    from src.models.shared import Note
+
+    note = Note.model_validate({"text": ["First paragraph.", "Second paragraph."]})
+    assert note.text == "First paragraph.\nSecond paragraph."
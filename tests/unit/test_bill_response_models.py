@@ -48,3 +48,27 @@ def test_bill_actions_response_parse():
     assert a.text == "Introduced in House"
     assert a.action_code == "00"
     assert isinstance(a.action_date, datetime)
+
+
+def test_latest_format_url_prefers_most_recent_version():
+    from src.models.bills import TextVersion, _latest_format_url
+
+    older = TextVersion(
+        date="2023-01-01T00:00:00Z",
+        type="Introduced in House",
+        formats=[
+            {"type": "PDF", "url": "https://www.congress.gov/118/bills/hr1/BILLS-118hr1ih.pdf"},
+            {"type": "Formatted Text", "url": "https://www.congress.gov/118/bills/hr1/BILLS-118hr1ih.htm"},
+        ],
+    )
+    newer = TextVersion(
+        date="2024-01-01T00:00:00Z",
+        type="Reported in House",
+        formats=[
+            {"type": "Formatted Text", "url": "https://www.congress.gov/118/bills/hr1/BILLS-118hr1rh.htm"}
+        ],
+    )
+
+    url = _latest_format_url([older, newer], lambda t: t == "Formatted Text")
+    assert url.endswith("BILLS-118hr1rh.htm")
+    assert _latest_format_url([older], lambda t: t == "Formatted XML") is None
@@ -57,3 +57,79 @@ def test_relatedbills_and_textversions_counturl_parsing():
 
     assert isinstance(parsed_tv, CountUrl)
     assert parsed_tv.count == 0
+
+
+def test_add_bill_details_include_fetches_only_selected_endpoints():
+    class RecordingClient(FakeClient):
+        def __init__(self):
+            self.paths = []
+
+        def get_json(self, path):
+            self.paths.append(path)
+            return super().get_json(path)
+
+    bill = Bill(
+        congress=118,
+        type="HR",
+        number="1",
+        latestAction={"actionDate": "2024-01-01", "text": "Introduced"},
+        originChamber="House",
+        originChamberCode="H",
+        title="Example",
+        updateDate="2024-01-01",
+        updateDateIncludingText="2024-01-01",
+    )
+    client = RecordingClient()
+    bill.add_bill_details(client, include=("actions", "relatedBills"))
+
+    assert sorted(client.paths) == ["bill/118/hr/1/actions", "bill/118/hr/1/relatedbills"]
+    assert bill.actions == []
+    assert isinstance(bill.related_bills, CountUrl)
+    assert bill.summaries is None
+
+
+def test_full_text_is_fetched_only_on_demand():
+    class TextClient(FakeClient):
+        def __init__(self):
+            self.fetched = []
+
+        def get_json(self, path):
+            if path.endswith("/text"):
+                return {
+                    "textVersions": [
+                        {
+                            "date": "2024-01-02T00:00:00Z",
+                            "type": "Introduced in House",
+                            "formats": [
+                                {
+                                    "type": "Formatted Text",
+                                    "url": "https://www.congress.gov/118/bills/hr1/BILLS-118hr1ih.htm",
+                                }
+                            ],
+                        }
+                    ]
+                }
+            return super().get_json(path)
+
+        def fetch_text(self, url, parse=None, timeout=30):
+            self.fetched.append(url)
+            return "Bill text"
+
+    bill = Bill(
+        congress=118,
+        type="HR",
+        number="1",
+        latestAction={"actionDate": "2024-01-01", "text": "Introduced"},
+        originChamber="House",
+        originChamberCode="H",
+        title="Example",
+        updateDate="2024-01-01",
+        updateDateIncludingText="2024-01-01",
+    )
+    client = TextClient()
+    bill.add_bill_details(client, include=("textVersions",))
+    assert client.fetched == [] and bill.full_text == ""
+
+    assert bill.load_full_text(client) == "Bill text"
+    assert bill.load_full_text(client) == "Bill text"
+    assert len(client.fetched) == 1
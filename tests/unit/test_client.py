@@ -4,7 +4,9 @@ import pytest
 from pydantic import BaseModel
 import json
 from pathlib import Path
+from types import SimpleNamespace
 
+from src.data_collection import client as client_module
 from src.data_collection.client import CDGClient
 from src.models.endpoint_spec import EndpointSpec
 
@@ -24,6 +26,7 @@ def make_mock_response(json_obj: dict):
     class MockResp:
         def __init__(self, obj):
             self._obj = obj
+            self.content = json.dumps(obj).encode()
             self.headers = {"content-type": "application/json"}
 
         def json(self):
@@ -97,4 +100,227 @@ def test_iterate_pages_single_shot(monkeypatch):
     assert isinstance(resp_json, dict)
     assert isinstance(items, list)
     assert len(items) == len(sample.get("congresses", []))
-    
+
+
+def test_iterate_pages_fetches_pages_lazily(monkeypatch):
+    from src.models.endpoint_spec import PaginationSpec
+
+    c = CDGClient(api_key="")
+    pages = {
+        0: {
+            "congresses": [{"name": "118th Congress"}, {"name": "117th Congress"}],
+            "pagination": {
+                "count": 3,
+                "next": "https://api.congress.gov/v3/congress?offset=2&limit=2",
+            },
+        },
+        2: {"congresses": [{"name": "116th Congress"}], "pagination": {"count": 3}},
+    }
+    requested = []
+
+    def fake_get(url, params=None, timeout=None):
+        offset = int(params["offset"])
+        requested.append(offset)
+        return make_mock_response(pages[offset])
+
+    monkeypatch.setattr(c._session, "get", fake_get)
+
+    spec = EndpointSpec(name="congress", path_template="/congress", param_specs=[])
+    spec.response_model = CongressItem
+    spec.data_key = "congresses"
+    spec.pagination = PaginationSpec(default_limit=2)
+
+    itr = c.iterate_pages(spec)
+    items, _, meta = next(itr)
+    assert len(items) == 2
+    assert meta["next_offset"] == 2 and meta["total"] == 3
+    # the second page is only requested once the caller advances
+    assert requested == [0]
+
+    rest = list(itr)
+    assert requested == [0, 2]
+    assert [len(page) for page, _, _ in rest] == [1]
+
+
+def test_get_json_revalidates_with_etag(monkeypatch):
+    from src.data_collection.http_cache import ResponseCache
+
+    c = CDGClient(api_key="", cache=ResponseCache())
+    sent_headers = []
+
+    def fake_get(url, params=None, timeout=None, headers=None):
+        sent_headers.append(headers)
+        if headers:
+            resp = make_mock_response({})
+            resp.status_code = 304
+            resp.headers = {}
+            return resp
+        resp = make_mock_response({"congress": {"name": "118th Congress"}})
+        resp.status_code = 200
+        resp.headers["ETag"] = '"abc"'
+        return resp
+
+    monkeypatch.setattr(c._session, "get", fake_get)
+
+    first = c.get_json("congress/118")
+    second = c.get_json("congress/118")
+    assert sent_headers == [None, {"If-None-Match": '"abc"'}]
+    assert second == first == {"congress": {"name": "118th Congress"}}
+
+
+def test_get_json_serves_fresh_cache_entries_without_request(monkeypatch):
+    from src.data_collection.http_cache import ResponseCache
+
+    c = CDGClient(api_key="", cache=ResponseCache(ttl=3600))
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(url)
+        return make_mock_response({"congress": {"name": "118th Congress"}})
+
+    monkeypatch.setattr(c._session, "get", fake_get)
+
+    assert c.get_json("congress/118") == c.get_json("congress/118")
+    assert len(calls) == 1
+
+
+def test_coerce_records_skip_invalid_keeps_valid_records():
+    c = CDGClient(api_key="")
+    insts = c.coerce_records(
+        DummyModel, [{"id": 1}, {}, {"id": 3}, {"id": "x"}], skip_invalid=True
+    )
+    assert [i.id for i in insts] == [1, 3]
+
+
+def test_coerce_records_warns_on_unprocessed_fields(monkeypatch, caplog):
+    import src.data_collection.client as client_mod
+
+    monkeypatch.setattr(client_mod, "CONGRESS_STRICT_FIELD_CHECK", False)
+    c = CDGClient(api_key="")
+    with caplog.at_level("WARNING", logger=client_mod.logger.name):
+        c.coerce_records(DummyModel, [{"id": 1, "value": 0}, {"id": 2, "extra": 1}])
+    messages = [r.getMessage() for r in caplog.records]
+    assert len(messages) == 1
+    assert "['extra']" in messages[0]
+
+
+def test_get_model_validates_raw_json_body(monkeypatch):
+    from src.models.bills import BillActionsResponse
+
+    c = CDGClient(api_key="")
+    payload = {
+        "actions": [
+            {"actionDate": "2024-01-01", "text": "Introduced in House", "type": "IntroReferral"}
+        ]
+    }
+    monkeypatch.setattr(
+        c._session, "get", lambda url, params=None, timeout=None: make_mock_response(payload)
+    )
+
+    resp = c.get_model("bill/118/hr/1/actions", BillActionsResponse)
+    assert isinstance(resp, BillActionsResponse)
+    assert resp.actions[0].text == "Introduced in House"
+
+
+def test_fetch_text_reuses_parsed_text_on_304(monkeypatch):
+    from src.data_collection.http_cache import ResponseCache
+
+    c = CDGClient(api_key="", cache=ResponseCache())
+    parsed = []
+
+    def fake_get(url, timeout=None, headers=None):
+        resp = make_mock_response({})
+        if headers:
+            resp.status_code = 304
+            resp.headers = {}
+        else:
+            resp.status_code = 200
+            resp.text = "<p>Be it enacted</p>"
+            resp.headers = {"ETag": '"v1"'}
+        return resp
+
+    def parse(html):
+        parsed.append(html)
+        return html.replace("<p>", "").replace("</p>", "")
+
+    monkeypatch.setattr(
+        client_module, "get_shared_session", lambda: SimpleNamespace(get=fake_get)
+    )
+
+    url = "https://www.congress.gov/118/bills/hr1/BILLS-118hr1ih.htm"
+    assert c.fetch_text(url, parse=parse) == "Be it enacted"
+    assert c.fetch_text(url, parse=parse) == "Be it enacted"
+    assert parsed == ["<p>Be it enacted</p>"]
+
+
+def test_fetch_text_raises_on_error_status_without_api_key(monkeypatch):
+    import requests
+
+    c = CDGClient(api_key="secret")
+    seen = {}
+
+    def fake_get(url, timeout=None, **kwargs):
+        seen.update(kwargs)
+        resp = requests.Response()
+        resp.status_code = 403
+        resp.url = url
+        resp._content = b"<html>Forbidden</html>"
+        return resp
+
+    monkeypatch.setattr(
+        client_module, "get_shared_session", lambda: SimpleNamespace(get=fake_get)
+    )
+    monkeypatch.setattr(c._session, "get", lambda *a, **k: pytest.fail("API session"))
+
+    with pytest.raises(requests.HTTPError):
+        c.fetch_text("https://www.congress.gov/118/bills/hr1/BILLS-118hr1ih.htm")
+    assert "params" not in seen
+
+
+def test_cached_json_is_not_shared_between_callers(monkeypatch):
+    from src.data_collection.http_cache import ResponseCache
+
+    c = CDGClient(api_key="", cache=ResponseCache(ttl=60))
+
+    def fake_get(url, params=None, timeout=None, **kwargs):
+        resp = make_mock_response({"bill": {"notes": "text"}})
+        resp.headers = {"content-type": "application/json", "ETag": '"v1"'}
+        return resp
+
+    monkeypatch.setattr(c._session, "get", fake_get)
+
+    first = c.get_json("bill/118/hr/1")
+    first["bill"]["notes"] = [{"text": "text"}]
+    assert c.get_json("bill/118/hr/1") == {"bill": {"notes": "text"}}
+
+
+def test_async_client_rejects_response_cache():
+    from src.data_collection.async_client import AsyncCDGClient
+    from src.data_collection.http_cache import ResponseCache
+
+    with pytest.raises(ValueError):
+        AsyncCDGClient(api_key="", cache=ResponseCache())
+
+
+def test_fetch_text_cache_is_keyed_by_parser(monkeypatch):
+    from src.data_collection.http_cache import ResponseCache
+
+    c = CDGClient(api_key="", cache=ResponseCache(ttl=60))
+
+    def fake_get(url, timeout=None, **kwargs):
+        resp = make_mock_response({})
+        resp.status_code = 200
+        resp.text = "<p>Be it enacted</p>"
+        resp.headers = {"ETag": '"v1"'}
+        return resp
+
+    def strip_tags(html):
+        return html.replace("<p>", "").replace("</p>", "")
+
+    monkeypatch.setattr(
+        client_module, "get_shared_session", lambda: SimpleNamespace(get=fake_get)
+    )
+
+    url = "https://www.congress.gov/118/bills/hr1/BILLS-118hr1ih.htm"
+    assert c.fetch_text(url, parse=strip_tags) == "Be it enacted"
+    assert c.fetch_text(url) == "<p>Be it enacted</p>"
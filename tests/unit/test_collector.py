@@ -0,0 +1,83 @@
+from src.data_collection.collector import enrich_records, update_date_version
+
+
+def test_enrich_records_refetches_only_changed_items(tmp_path):
+    results = tmp_path / "details.jsonl"
+    items = [
+        {"id": "a", "updateDate": "2024-01-01"},
+        {"id": "b", "updateDate": "2024-01-01"},
+    ]
+    fetched = []
+
+    def fetch(item):
+        fetched.append(item["id"])
+        return {"seen": item["updateDate"]}
+
+    kwargs = dict(
+        detail_fetcher=fetch,
+        id_getter=lambda item: item["id"],
+        results_path=results,
+        version_getter=update_date_version,
+    )
+    enrich_records(items, **kwargs)
+    assert fetched == ["a", "b"]
+
+    items[1] = {"id": "b", "updateDate": "2024-02-01"}
+    records = enrich_records(items, **kwargs)
+    assert fetched == ["a", "b", "b"]
+    assert {r["_id"]: r["seen"] for r in records} == {
+        "a": "2024-01-01",
+        "b": "2024-02-01",
+    }
+    # The stale copy of "b" is compacted away rather than left in the file.
+    assert len(results.read_bytes().splitlines()) == 2
+
+
+def test_iter_records_reads_jsonl_and_legacy_arrays(tmp_path):
+    from src.data_collection.collector import _iter_records
+
+    jsonl = tmp_path / "new.jsonl"
+    jsonl.write_bytes(b'{"_id": "a"}\n\n{"_id": "b"}\n')
+    legacy = tmp_path / "old.json"
+    legacy.write_bytes(b'\n[\n  {"_id": "a"},\n  {"_id": "b"}\n]\n')
+
+    assert [r["_id"] for r in _iter_records(jsonl)] == ["a", "b"]
+    assert [r["_id"] for r in _iter_records(legacy)] == ["a", "b"]
+
+
+def test_migrate_legacy_results_rewrites_arrays_only(tmp_path):
+    from src.data_collection.collector import _iter_records, _migrate_legacy_results
+
+    jsonl = tmp_path / "new.jsonl"
+    jsonl.write_bytes(b'{"_id": "a"}\n')
+    legacy = tmp_path / "old.json"
+    legacy.write_bytes(b'\n[\n  {"_id": "a"},\n  {"_id": "b"}\n]\n')
+
+    _migrate_legacy_results(jsonl)
+    _migrate_legacy_results(legacy)
+
+    assert jsonl.read_bytes() == b'{"_id": "a"}\n'
+    assert not legacy.read_bytes().lstrip().startswith(b"[")
+    assert [r["_id"] for r in _iter_records(legacy)] == ["a", "b"]
+
+
+def test_migrate_legacy_results_keeps_original_on_failure(tmp_path, monkeypatch):
+    from src.data_collection import collector
+
+    legacy = tmp_path / "old.json"
+    original = b'[{"_id": "a"}, {"_id": "b"}]'
+    legacy.write_bytes(original)
+
+    def failing_append(path, records):
+        with open(path, "ab") as f:
+            f.write(b'{"_id": "a"}\n')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(collector, "append_jsonl", failing_append)
+
+    try:
+        collector._migrate_legacy_results(legacy)
+    except OSError:
+        pass
+    assert legacy.read_bytes() == original
+    assert list(tmp_path.iterdir()) == [legacy]
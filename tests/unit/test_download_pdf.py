@@ -0,0 +1,111 @@
+import io
+
+import pytest
+
+from src.data_collection import client, utils
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", content_type="application/pdf"):
+        self.status_code = status_code
+        self.headers = {"content-type": content_type}
+        self.raw = io.BytesIO(body)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs.get("headers"))
+        return self.responses.pop(0)
+
+
+def test_403_is_retried_with_browser_headers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    session = FakeSession([FakeResponse(403), FakeResponse(200, b"%PDF-1.7")])
+    monkeypatch.setattr(client, "get_shared_session", lambda: session)
+    monkeypatch.setattr(
+        utils, "_download_pdf_with_browser", lambda *a: pytest.fail("browser used")
+    )
+
+    name = utils.download_pdf("https://www.congress.gov/files/doc.pdf")
+
+    assert name == "files_doc.pdf"
+    assert (tmp_path / "tmp" / "files_doc.pdf").read_bytes() == b"%PDF-1.7"
+    assert session.calls == [None, utils.PDF_HEADERS]
+
+
+def test_repeated_403_falls_back_to_browser(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    session = FakeSession([FakeResponse(403), FakeResponse(403)])
+    monkeypatch.setattr(client, "get_shared_session", lambda: session)
+    monkeypatch.setattr(
+        utils, "_download_pdf_with_browser", lambda url, folder, name: "browser"
+    )
+
+    assert utils.download_pdf("https://www.congress.gov/files/doc.pdf") == "browser"
+    assert len(session.calls) == 2
+
+
+def test_interrupted_download_leaves_no_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    class BrokenStream(io.BytesIO):
+        def read(self, *args):
+            raise OSError("connection reset")
+
+    resp = FakeResponse(200)
+    resp.raw = BrokenStream()
+    monkeypatch.setattr(client, "get_shared_session", lambda: FakeSession([resp]))
+
+    with pytest.raises(OSError):
+        utils.download_pdf("https://www.congress.gov/files/doc.pdf")
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_download_pdfs_saves_files_and_cleans_up_failures(tmp_path):
+    import asyncio
+
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def good(request):
+        return web.Response(body=b"%PDF-1.7", content_type="application/pdf")
+
+    async def truncated(request):
+        resp = web.StreamResponse(headers={"Content-Length": "100"})
+        await resp.prepare(request)
+        await resp.write(b"%PDF")
+        request.transport.close()
+        return resp
+
+    app = web.Application()
+    app.router.add_get("/good.pdf", good)
+    app.router.add_get("/truncated.pdf", truncated)
+
+    async def run():
+        async with TestServer(app) as server:
+            urls = [str(server.make_url(p)) for p in ("/good.pdf", "/truncated.pdf")]
+            return await utils.download_pdfs(urls, folder=str(tmp_path), max_retries=0)
+
+    good_name, failure = asyncio.run(run())
+
+    assert good_name == "good.pdf"
+    assert (tmp_path / "good.pdf").read_bytes() == b"%PDF-1.7"
+    assert isinstance(failure, Exception)
+    assert not (tmp_path / "truncated.pdf").exists()
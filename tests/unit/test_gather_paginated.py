@@ -0,0 +1,59 @@
+import threading
+
+from src.data_collection.utils import gather_paginated_records
+
+
+def make_fetch(items, cap, total=None):
+    requested = []
+    lock = threading.Lock()
+
+    def fetch_page(offset, page_size):
+        with lock:
+            requested.append((offset, page_size))
+        size = min(page_size, cap)
+        page = items[offset : offset + size]
+        pagination = {"count": total if total is not None else len(items)}
+        if offset + size < len(items):
+            pagination["next"] = (
+                f"https://api.congress.gov/v3/bill?offset={offset + size}&limit={size}"
+            )
+        return {"bills": page, "pagination": pagination}
+
+    return fetch_page, requested
+
+
+def test_concurrent_pages_follow_server_page_size():
+    items = list(range(7))
+    fetch_page, requested = make_fetch(items, cap=2)
+
+    result = gather_paginated_records(
+        fetch_page,
+        data_key="bills",
+        desc="bills",
+        unit="bill",
+        page_size=5,
+        wait=0,
+        max_workers=2,
+    )
+
+    assert result.records == items
+    assert sorted(requested[1:]) == [(2, 2), (4, 2), (6, 2)]
+
+
+def test_concurrent_pages_stop_after_a_short_page():
+    items = list(range(6))
+    fetch_page, requested = make_fetch(items, cap=2, total=100)
+
+    result = gather_paginated_records(
+        fetch_page,
+        data_key="bills",
+        desc="bills",
+        unit="bill",
+        page_size=2,
+        wait=0,
+        max_workers=2,
+    )
+
+    assert result.records == items
+    # Only the bounded window past the last page is ever requested.
+    assert len(requested) <= 3 + 2
@@ -0,0 +1,26 @@
+from src.data_collection.http_cache import CachedResponse, SqliteResponseCache
+
+
+def test_sqlite_cache_persists_entries_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = SqliteResponseCache(path)
+    key = cache.make_key("https://api.congress.gov/v3/congress/118", {"format": "json"})
+    cache.set(key, CachedResponse(body={"congress": {"number": 118}}, etag='"v1"'))
+    cache.close()
+
+    reopened = SqliteResponseCache(path)
+    entry = reopened.get(key)
+    assert entry is not None
+    assert entry.body == {"congress": {"number": 118}}
+    assert entry.validator_headers() == {"If-None-Match": '"v1"'}
+    assert reopened.get("missing") is None
+    reopened.close()
+
+
+def test_sqlite_cache_evicts_oldest_beyond_max_entries(tmp_path):
+    cache = SqliteResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+    for i in range(3):
+        cache.set(f"k{i}", CachedResponse(body=i, stored_at=float(i)))
+    assert cache.get("k0") is None
+    assert cache.get("k2").body == 2
+    cache.close()
@@ -15,4 +15,4 @@ def test_law_list_item_parse():
     inst = LawListItem.model_validate(sample)
     assert inst.congress == 117
     assert inst.laws and inst.laws[0].number == "34"
-    assert inst.url.host == "api.congress.gov"
+    assert inst.url.startswith("https://api.congress.gov/")
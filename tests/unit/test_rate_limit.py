@@ -0,0 +1,71 @@
+import time
+
+from src.data_collection.rate_limit import SlidingWindowLimiter, TokenBucket
+
+
+def test_token_bucket_allows_burst_then_reports_wait():
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    wait = bucket.try_acquire()
+    assert 0.0 < wait <= 1.0
+
+
+def test_token_bucket_per_hour_rate():
+    bucket = TokenBucket.per_hour(5000)
+    assert abs(bucket.rate - 5000 / 3600) < 1e-9
+
+
+def test_token_bucket_acquire_async_waits_for_refill():
+    import asyncio
+    import time
+
+    bucket = TokenBucket(rate=50.0, capacity=1)
+
+    async def take_two():
+        await bucket.acquire_async()
+        await bucket.acquire_async()
+
+    start = time.monotonic()
+    asyncio.run(take_two())
+    assert time.monotonic() - start >= 0.015
+
+
+def test_sliding_window_caps_requests_within_window():
+    limiter = SlidingWindowLimiter(max_requests=3, window=0.05)
+    assert [limiter.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    wait = limiter.try_acquire()
+    assert 0.0 < wait <= 0.05
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= wait * 0.9
+
+
+def test_adaptive_concurrency_grows_on_success_and_halves_on_throttle():
+    import asyncio
+
+    from src.data_collection.rate_limit import AdaptiveConcurrency
+
+    gate = AdaptiveConcurrency(initial=2, max_limit=4)
+    peak = 0
+
+    async def worker():
+        nonlocal peak
+        async with gate:
+            peak = max(peak, gate.in_flight)
+            await asyncio.sleep(0.005)
+
+    async def run():
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+    for _ in range(10):
+        gate.on_success()
+    assert gate.limit == 4
+    gate.on_throttle()
+    assert gate.limit == 2
+    gate.on_throttle()
+    gate.on_throttle()
+    assert gate.limit == 1